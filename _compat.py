@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Python version gates and optional dependencies shared by the subpackages
+"""
+import sys
+
+# __slots__ drop the per-instance __dict__ (dataclass slots need Python 3.10+)
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+try:
+    import orjson
+except ImportError:  # installed through the speedups extra
+    orjson = None
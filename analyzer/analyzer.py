@@ -3,16 +3,11 @@
 """
 Intelligent system load analyzer
 """
-import sys
-from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
-# Add parent directory to path for imports  
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from config import Config
-from collector.models import MetricsData
-from analyzer.models import (
+from ..config import Config
+from ..collector.models import MetricsData
+from .models import (
     AnalysisResult, Issue, IssueType, IssueSeverity, LoadStatus
 )
 
@@ -311,6 +306,9 @@ class Analyzer:
             
         interrupts = metrics.interrupts
         
+        # CPU中断分布统计只计算一次，供分析和建议共用
+        cpu_avg, max_cpu_interrupts = self._get_distribution_stats(interrupts.cpu_interrupt_distribution)
+        
         # 1. 分析硬中断负载
         if interrupts.interrupt_rate and interrupts.interrupt_rate > self.config.max_interrupt_rate:
             result.add_issue(Issue(
@@ -328,22 +326,19 @@ class Analyzer:
             ))
         
         # 2. 分析CPU中断分布不均
-        if interrupts.cpu_interrupt_distribution:
-            cpu_avg = sum(interrupts.cpu_interrupt_distribution) / len(interrupts.cpu_interrupt_distribution)
-            max_cpu_interrupts = max(interrupts.cpu_interrupt_distribution)
-            if cpu_avg > 0 and max_cpu_interrupts > cpu_avg * 3:  # 某个CPU的中断数是平均值的3倍以上
-                result.add_issue(Issue(
-                    type=IssueType.CPU,
-                    severity=IssueSeverity.MEDIUM,
-                    message=f"CPU{interrupts.hottest_cpu} 中断负载过高: {max_cpu_interrupts} 中断 (平均: {cpu_avg:.0f})",
-                    value=max_cpu_interrupts,
-                    threshold=cpu_avg * 2,
-                    recommendation="建议使用irqbalance或手动调整中断亲和性",
-                    additional_data={
-                        "hottest_cpu": interrupts.hottest_cpu,
-                        "imbalance_ratio": max_cpu_interrupts / cpu_avg if cpu_avg > 0 else 0
-                    }
-                ))
+        if cpu_avg > 0 and max_cpu_interrupts > cpu_avg * 3:  # 某个CPU的中断数是平均值的3倍以上
+            result.add_issue(Issue(
+                type=IssueType.CPU,
+                severity=IssueSeverity.MEDIUM,
+                message=f"CPU{interrupts.hottest_cpu} 中断负载过高: {max_cpu_interrupts} 中断 (平均: {cpu_avg:.0f})",
+                value=max_cpu_interrupts,
+                threshold=cpu_avg * 2,
+                recommendation="建议使用irqbalance或手动调整中断亲和性",
+                additional_data={
+                    "hottest_cpu": interrupts.hottest_cpu,
+                    "imbalance_ratio": max_cpu_interrupts / cpu_avg
+                }
+            ))
         
         # 3. 分析网卡中断热点
         for net_int in interrupts.network_interrupts:
@@ -415,19 +410,24 @@ class Analyzer:
                 ))
         
         # 7. 添加优化建议
-        self._add_interrupt_recommendations(result, interrupts)
+        self._add_interrupt_recommendations(result, interrupts, cpu_avg, max_cpu_interrupts)
+    
+    @staticmethod
+    def _get_distribution_stats(distribution: List[int]) -> Tuple[float, int]:
+        """计算CPU中断分布的平均值和最大值"""
+        if not distribution:
+            return 0.0, 0
+        return sum(distribution) / len(distribution), max(distribution)
     
-    def _add_interrupt_recommendations(self, result: AnalysisResult, interrupts) -> None:
+    def _add_interrupt_recommendations(self, result: AnalysisResult, interrupts,
+                                       cpu_avg: float, max_cpu_interrupts: int) -> None:
         """添加中断优化建议"""
         recommendations = set(result.recommendations or [])
         
         # 中断不均衡建议
-        if interrupts.cpu_interrupt_distribution:
-            cpu_avg = sum(interrupts.cpu_interrupt_distribution) / len(interrupts.cpu_interrupt_distribution)
-            max_cpu_interrupts = max(interrupts.cpu_interrupt_distribution)
-            if cpu_avg > 0 and max_cpu_interrupts > cpu_avg * 2:
-                recommendations.add("检测到中断负载不均衡，建议启用 irqbalance 服务或手动绑定中断到多核")
-                recommendations.add(f"可以使用: echo <CPU-mask> > /proc/irq/<IRQ-number>/smp_affinity 调整中断亲和性")
+        if cpu_avg > 0 and max_cpu_interrupts > cpu_avg * 2:
+            recommendations.add("检测到中断负载不均衡，建议启用 irqbalance 服务或手动绑定中断到多核")
+            recommendations.add(f"可以使用: echo <CPU-mask> > /proc/irq/<IRQ-number>/smp_affinity 调整中断亲和性")
         
         # 网卡中断优化建议
         high_net_interrupts = [ni for ni in interrupts.network_interrupts 
@@ -480,20 +480,20 @@ class Analyzer:
             recommendations.add("System is under high load - investigate primary issues")
         
         # Add specific recommendations based on issue combinations
-        cpu_issues = [i for i in result.get_all_issues() if i.type == IssueType.CPU]
-        memory_issues = [i for i in result.get_all_issues() if i.type == IssueType.MEMORY]
-        iowait_issues = [i for i in result.get_all_issues() if i.type == IssueType.IOWAIT]
+        issues_by_type = result.get_issues_by_type()
         
-        if cpu_issues and memory_issues:
+        if IssueType.CPU in issues_by_type and IssueType.MEMORY in issues_by_type:
             recommendations.add("High CPU and memory usage detected - consider vertical scaling")
         
-        if iowait_issues and any(i.type == IssueType.DISK_IO for i in result.get_all_issues()):
+        if IssueType.IOWAIT in issues_by_type and IssueType.DISK_IO in issues_by_type:
             recommendations.add("I/O bottleneck detected - consider faster storage or I/O optimization")
         
         result.recommendations = list(recommendations)
     
     def _create_summary(self, metrics: MetricsData, result: AnalysisResult) -> None:
         """Create analysis summary"""
+        top_by_cpu = metrics.top_processes.get('by_cpu')
+        top_by_memory = metrics.top_processes.get('by_memory')
         result.summary = {
             'total_issues': len(result.get_all_issues()),
             'critical_issues': len(result.get_critical_issues()),
@@ -503,8 +503,8 @@ class Analyzer:
             'memory_usage': metrics.memory.used_percent,
             'iowait_percent': metrics.cpu.iowait_percent,
             'tcp_connections': metrics.network.total_connections,
-            'top_cpu_process': metrics.top_processes['by_cpu'][0].name if metrics.top_processes.get('by_cpu') else None,
-            'top_memory_process': metrics.top_processes['by_memory'][0].name if metrics.top_processes.get('by_memory') else None
+            'top_cpu_process': top_by_cpu[0].name if top_by_cpu else None,
+            'top_memory_process': top_by_memory[0].name if top_by_memory else None
         }
     
     def _get_severity_by_ratio(self, value: float, threshold: float, high_threshold: Optional[float] = None, critical_threshold: Optional[float] = None) -> IssueSeverity:
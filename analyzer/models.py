@@ -3,16 +3,12 @@
 """
 Analysis models and data structures
 """
-import sys
-from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Any, Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from collector.models import MetricsData, ProcessInfo
+from .._compat import DATACLASS_OPTIONS
+from ..collector.models import MetricsData, ProcessInfo
 
 
 class IssueType(Enum):
@@ -42,7 +38,7 @@ class LoadStatus(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Issue:
     """Represents a system issue"""
     type: IssueType
@@ -77,7 +73,7 @@ class Issue:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AnalysisResult:
     """Complete analysis result"""
     timestamp: str
@@ -98,6 +94,13 @@ class AnalysisResult:
         """Get all issues combined"""
         return self.primary_issues + self.secondary_issues
     
+    def get_issues_by_type(self) -> Dict[IssueType, List[Issue]]:
+        """Group all issues by type in a single pass (primary issues first)"""
+        issues_by_type: Dict[IssueType, List[Issue]] = {}
+        for issue in self.get_all_issues():
+            issues_by_type.setdefault(issue.type, []).append(issue)
+        return issues_by_type
+    
     def get_critical_issues(self) -> List[Issue]:
         """Get only critical issues"""
         return [issue for issue in self.get_all_issues() 
@@ -6,16 +6,22 @@ Command line interface for load analyzer
 import sys
 import time
 import argparse
+import dataclasses
+import importlib
 from pathlib import Path
 from typing import List, Optional
 
-# Add current directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+if not __package__:
+    # Run as a script (python cli.py): import the enclosing package (PEP 366)
+    _package_dir = Path(__file__).resolve().parent
+    sys.path.insert(0, str(_package_dir.parent))
+    __package__ = _package_dir.name
+    importlib.import_module(__package__)
 
-from config import Config, ConfigManager, OutputFormat
-from collector import DataCollector
-from analyzer import Analyzer
-from reporter import Reporter
+from .config import Config, ConfigManager, OutputFormat
+from .collector import DataCollector
+from .analyzer import Analyzer
+from .reporter import Reporter, CsvReporter
 
 
 class LoadAnalyzerCLI:
@@ -173,44 +179,51 @@ Examples:
         config = ConfigManager.load_config(args.config)
         
         # Override with command line arguments
+        overrides = {}
+        
         if args.interval:
-            config.sample_interval = args.interval
+            overrides['sample_interval'] = args.interval
         
         if args.count:
-            config.sample_count = args.count
+            overrides['sample_count'] = args.count
         
         if args.format:
-            config.output_format = OutputFormat(args.format)
+            overrides['output_format'] = OutputFormat(args.format)
         
         if args.output:
-            config.output_file = args.output
+            overrides['output_file'] = args.output
         
         if args.no_colors:
-            config.enable_colors = False
+            overrides['enable_colors'] = False
         
         # Threshold overrides
         if args.load_threshold is not None:
-            config.load_threshold_multiplier = args.load_threshold
+            overrides['load_threshold_multiplier'] = args.load_threshold
         
         if args.cpu_threshold is not None:
-            config.cpu_threshold = args.cpu_threshold
+            overrides['cpu_threshold'] = args.cpu_threshold
         
         if args.memory_threshold is not None:
-            config.memory_threshold = args.memory_threshold
+            overrides['memory_threshold'] = args.memory_threshold
         
         if args.iowait_threshold is not None:
-            config.iowait_threshold = args.iowait_threshold
+            overrides['iowait_threshold'] = args.iowait_threshold
         
         if args.top_processes is not None:
-            config.top_processes_count = args.top_processes
+            overrides['top_processes_count'] = args.top_processes
         
         if args.enable_prometheus:
-            config.enable_prometheus = True
+            overrides['enable_prometheus'] = True
         
         if args.prometheus_port:
-            config.prometheus_port = args.prometheus_port
+            overrides['prometheus_port'] = args.prometheus_port
         
-        return config
+        # Config is frozen; replace() builds a new validated instance
+        try:
+            return dataclasses.replace(config, **overrides)
+        except ValueError as e:
+            # Report out-of-range flags as a usage error instead of a traceback
+            self.setup_parser().error(str(e))
     
     def initialize_components(self, config: Config) -> None:
         """Initialize analyzer components"""
@@ -228,16 +241,14 @@ Examples:
             # Analyze
             analysis = self.analyzer.analyze(metrics)
             
-            # Generate report
-            report = self.reporter.generate_report(metrics, analysis)
-            
             # Output report
             if self.config.output_file:
-                with open(self.config.output_file, 'w', encoding='utf-8') as f:
-                    f.write(report)
+                with open(self.config.output_file, 'w', encoding='utf-8',
+                          buffering=self.reporter.WRITE_BUFFER_SIZE) as f:
+                    self.reporter.write_report(metrics, analysis, f)
                 print(f"Report saved to {self.config.output_file}")
             else:
-                print(report)
+                print(self.reporter.generate_report(metrics, analysis))
                 
         except Exception as e:
             print(f"Error during analysis: {e}", file=sys.stderr)
@@ -324,10 +335,19 @@ Examples:
         """Save multiple samples to file"""
         if self.config.output_format == OutputFormat.JSON:
             import json
-            with open(self.config.output_file, 'w', encoding='utf-8') as f:
+            with open(self.config.output_file, 'w', encoding='utf-8',
+                      buffering=self.reporter.WRITE_BUFFER_SIZE) as f:
                 json.dump(samples, f, indent=2, default=str)
+        elif self.config.output_format == OutputFormat.CSV:
+            # One header followed by a row per sample
+            csv_reporter = CsvReporter(self.config)
+            with open(self.config.output_file, 'w', encoding='utf-8', newline='',
+                      buffering=self.reporter.WRITE_BUFFER_SIZE) as f:
+                for sample in samples:
+                    csv_reporter.append_row(sample['metrics'], sample['analysis'], f)
         else:
-            with open(self.config.output_file, 'w', encoding='utf-8') as f:
+            with open(self.config.output_file, 'w', encoding='utf-8',
+                      buffering=self.reporter.WRITE_BUFFER_SIZE) as f:
                 for i, sample in enumerate(samples):
                     f.write(f"\n{'='*20} Sample {i+1} {'='*20}\n")
                     report = self.reporter.generate_report(sample['metrics'], sample['analysis'])
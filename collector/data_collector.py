@@ -7,15 +7,12 @@ import os
 import time
 import subprocess
 import psutil
-import sys
-from pathlib import Path
+from collections import Counter
+from itertools import zip_longest
 from typing import Dict, List, Tuple, Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from config import Config
-from collector.models import (
+from ..config import Config
+from .models import (
     MetricsData, LoadMetrics, CPUMetrics, MemoryMetrics, 
     DiskIOMetrics, NetworkMetrics, ProcessInfo,
     InterruptMetrics, InterruptInfo, SoftIRQInfo, ContextSwitchInfo
@@ -103,23 +100,26 @@ class DataCollector:
         if not disk_io:
             return DiskIOMetrics(0, 0, 0, 0, 0, 0)
         
+        # Calculate rates if we have previous data (metrics are frozen once built)
+        read_rate = write_rate = None
+        current_time = time.time()
+        if self.previous_disk_io:
+            time_diff = current_time - self.previous_disk_io['timestamp']
+            if time_diff > 0:
+                read_rate = (disk_io.read_bytes - self.previous_disk_io['read_bytes']) / time_diff
+                write_rate = (disk_io.write_bytes - self.previous_disk_io['write_bytes']) / time_diff
+        
         metrics = DiskIOMetrics(
             read_count=disk_io.read_count,
             write_count=disk_io.write_count,
             read_bytes=disk_io.read_bytes,
             write_bytes=disk_io.write_bytes,
             read_time=disk_io.read_time,
-            write_time=disk_io.write_time
+            write_time=disk_io.write_time,
+            read_rate=read_rate,
+            write_rate=write_rate
         )
         
-        # Calculate rates if we have previous data
-        current_time = time.time()
-        if self.previous_disk_io:
-            time_diff = current_time - self.previous_disk_io['timestamp']
-            if time_diff > 0:
-                metrics.read_rate = (metrics.read_bytes - self.previous_disk_io['read_bytes']) / time_diff
-                metrics.write_rate = (metrics.write_bytes - self.previous_disk_io['write_bytes']) / time_diff
-        
         # Store current data for next calculation
         self.previous_disk_io = {
             'read_bytes': metrics.read_bytes,
@@ -134,12 +134,10 @@ class DataCollector:
         try:
             # Get all connections
             connections = psutil.net_connections(kind='tcp')
-            tcp_states = {}
             total_connections = len(connections)
             
-            for conn in connections:
-                state = conn.status
-                tcp_states[state] = tcp_states.get(state, 0) + 1
+            # Count connections per TCP state
+            tcp_states = dict(Counter(conn.status for conn in connections))
             
             # Get network I/O stats
             net_io = psutil.net_io_counters()
@@ -217,9 +215,9 @@ class DataCollector:
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         
-        # Sort processes
-        processes.sort(key=lambda x: getattr(x, sort_by, 0), reverse=True)
-        return processes[:self.config.top_processes_count]
+        # Select top processes
+        return ProcessInfo.top_k(processes, self.config.top_processes_count,
+                                 key=lambda x: getattr(x, sort_by, 0))
     
     def collect_all_metrics(self) -> MetricsData:
         """Collect all system metrics"""
@@ -345,9 +343,9 @@ class DataCollector:
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         
-        # Sort by total I/O bytes
-        processes.sort(key=lambda x: x.io_counters.get('total_bytes', 0) if x.io_counters else 0, reverse=True)
-        return processes[:self.config.top_processes_count]
+        # Select top processes by total I/O bytes
+        return ProcessInfo.top_k(processes, self.config.top_processes_count,
+                                 key=lambda x: x.io_counters.get('total_bytes', 0) if x.io_counters else 0)
     
     def get_interrupt_metrics(self) -> InterruptMetrics:
         """收集中断相关指标"""
@@ -355,8 +353,11 @@ class DataCollector:
         time_delta = current_time - self.start_time if hasattr(self, 'previous_interrupts') and self.previous_interrupts else 1.0
         
         # 1. 收集硬中断信息
-        interrupts_data = self._parse_proc_interrupts()
-        total_interrupts = sum(sum(cpu_counts) for cpu_counts in interrupts_data.values())
+        interrupts_data, irq_descriptions = self._parse_proc_interrupts()
+        
+        # 按CPU列汇总中断数，总中断数直接由列汇总得出
+        cpu_interrupt_distribution = self._get_cpu_interrupt_distribution(interrupts_data)
+        total_interrupts = sum(cpu_interrupt_distribution)
         
         # 计算中断率
         interrupt_rate = None
@@ -365,10 +366,9 @@ class DataCollector:
             interrupt_rate = interrupt_delta / time_delta if time_delta > 0 else 0
         
         # 2. 收集网卡中断信息
-        network_interrupts = self._get_network_interrupts(interrupts_data, time_delta)
+        network_interrupts = self._get_network_interrupts(interrupts_data, irq_descriptions, time_delta)
         
         # 3. 计算CPU中断分布
-        cpu_interrupt_distribution = self._get_cpu_interrupt_distribution(interrupts_data)
         hottest_cpu = cpu_interrupt_distribution.index(max(cpu_interrupt_distribution)) if cpu_interrupt_distribution else None
         
         # 4. 收集ksoftirqd进程信息
@@ -394,9 +394,10 @@ class DataCollector:
             high_switch_processes=high_switch_processes
         )
     
-    def _parse_proc_interrupts(self) -> Dict[str, List[int]]:
-        """解析/proc/interrupts文件"""
+    def _parse_proc_interrupts(self) -> Tuple[Dict[str, List[int]], Dict[str, List[str]]]:
+        """解析/proc/interrupts文件，返回每个IRQ的各CPU中断次数及其描述字段"""
         interrupts_data = {}
+        irq_descriptions = {}
         try:
             with open('/proc/interrupts', 'r') as f:
                 lines = f.readlines()
@@ -419,57 +420,48 @@ class DataCollector:
                         break
                 
                 interrupts_data[irq_name] = cpu_counts
+                # 计数之后的字段为中断控制器和设备名称
+                irq_descriptions[irq_name] = parts[len(cpu_counts) + 1:]
                 
         except (FileNotFoundError, PermissionError):
             pass
             
-        return interrupts_data
+        return interrupts_data, irq_descriptions
     
-    def _get_network_interrupts(self, interrupts_data: Dict[str, List[int]], time_delta: float) -> List[InterruptInfo]:
-        """获取网卡相关的中断信息"""
+    def _get_network_interrupts(self, interrupts_data: Dict[str, List[int]],
+                                irq_descriptions: Dict[str, List[str]], time_delta: float) -> List[InterruptInfo]:
+        """获取网卡相关的中断信息（复用已解析的/proc/interrupts数据）"""
         network_interrupts = []
         
-        try:
-            with open('/proc/interrupts', 'r') as f:
-                lines = f.readlines()
-                
-            for line in lines[1:]:
-                parts = line.strip().split()
-                if not parts or not parts[0].rstrip(':').isdigit():
-                    continue
-                    
-                irq_number = int(parts[0].rstrip(':'))
-                
-                # 检查是否为网络设备中断
-                line_lower = line.lower()
-                if any(keyword in line_lower for keyword in ['eth', 'ens', 'enp', 'wlan', 'wifi']):
-                    # 提取设备名称
-                    device_name = "unknown"
-                    for part in parts:
-                        if any(keyword in part.lower() for keyword in ['eth', 'ens', 'enp', 'wlan']):
-                            device_name = part
-                            break
-                    
-                    if str(irq_number) in interrupts_data:
-                        cpu_distribution = interrupts_data[str(irq_number)]
-                        interrupt_count = sum(cpu_distribution)
-                        
-                        # 计算中断率
-                        rate = None
-                        if hasattr(self, 'previous_net_interrupts') and str(irq_number) in self.previous_net_interrupts:
-                            prev_count = self.previous_net_interrupts[str(irq_number)]
-                            rate = (interrupt_count - prev_count) / time_delta if time_delta > 0 else 0
-                        
-                        network_interrupts.append(InterruptInfo(
-                            irq_number=irq_number,
-                            device_name=device_name,
-                            interrupt_count=interrupt_count,
-                            cpu_distribution=cpu_distribution,
-                            rate=rate
-                        ))
-                        
-        except (FileNotFoundError, PermissionError):
-            pass
+        for irq_name, description in irq_descriptions.items():
+            # 检查是否为网络设备中断
+            description_lower = ' '.join(description).lower()
+            if not any(keyword in description_lower for keyword in ['eth', 'ens', 'enp', 'wlan', 'wifi']):
+                continue
+            
+            # 提取设备名称
+            device_name = "unknown"
+            for part in description:
+                if any(keyword in part.lower() for keyword in ['eth', 'ens', 'enp', 'wlan']):
+                    device_name = part
+                    break
+            
+            cpu_distribution = interrupts_data[irq_name]
+            interrupt_count = sum(cpu_distribution)
+            
+            # 计算中断率
+            rate = None
+            if hasattr(self, 'previous_net_interrupts') and irq_name in self.previous_net_interrupts:
+                prev_count = self.previous_net_interrupts[irq_name]
+                rate = (interrupt_count - prev_count) / time_delta if time_delta > 0 else 0
+            
+            network_interrupts.append(InterruptInfo(
+                irq_number=int(irq_name),
+                device_name=device_name,
+                interrupt_count=interrupt_count,
+                cpu_distribution=cpu_distribution,
+                rate=rate
+            ))
             
         # 保存当前中断计数供下次使用
         if not hasattr(self, 'previous_net_interrupts'):
@@ -484,16 +476,8 @@ class DataCollector:
         if not interrupts_data:
             return []
             
-        # 确定CPU核心数
-        max_cpus = max(len(counts) for counts in interrupts_data.values()) if interrupts_data else 0
-        cpu_totals = [0] * max_cpus
-        
-        for cpu_counts in interrupts_data.values():
-            for i, count in enumerate(cpu_counts):
-                if i < len(cpu_totals):
-                    cpu_totals[i] += count
-                    
-        return cpu_totals
+        # 按列转置后逐列求和（较短的行按0补齐），避免逐元素的Python循环
+        return [sum(column) for column in zip_longest(*interrupts_data.values(), fillvalue=0)]
     
     def _get_ksoftirqd_processes(self) -> List[SoftIRQInfo]:
         """获取ksoftirqd进程信息"""
@@ -3,12 +3,18 @@
 """
 Data structures for metrics collection
 """
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
+from .._compat import DATACLASS_OPTIONS
 
-@dataclass
+# Snapshot models are never modified after collection, so they can be shared safely
+_FROZEN_DATACLASS_OPTIONS = dict(DATACLASS_OPTIONS, frozen=True)
+
+
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class LoadMetrics:
     """Load average metrics"""
     load1: float
@@ -17,7 +23,7 @@ class LoadMetrics:
     cpu_count: int
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class CPUMetrics:
     """CPU usage metrics"""
     usage_per_core: List[float]
@@ -28,7 +34,7 @@ class CPUMetrics:
     interrupts: int
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class MemoryMetrics:
     """Memory usage metrics"""
     total_gb: float
@@ -40,7 +46,7 @@ class MemoryMetrics:
     cached_gb: float
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class DiskIOMetrics:
     """Disk I/O metrics"""
     read_count: int
@@ -66,7 +72,7 @@ class DiskIOMetrics:
         }
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class NetworkMetrics:
     """Network metrics"""
     tcp_connections: Dict[str, int]
@@ -78,7 +84,7 @@ class NetworkMetrics:
     tcp_backlog: Dict[str, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class ProcessInfo:
     """Process information"""
     pid: int
@@ -89,9 +95,15 @@ class ProcessInfo:
     cmdline: str
     connections: int
     io_counters: Optional[Dict[str, int]] = None
+    
+    @staticmethod
+    def top_k(processes: Iterable['ProcessInfo'], k: int,
+              key: Callable[['ProcessInfo'], Any]) -> List['ProcessInfo']:
+        """Select the k largest processes by key, in descending order (O(n log k), no full sort)"""
+        return heapq.nlargest(k, processes, key=key)
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class InterruptInfo:
     """网卡中断信息"""
     irq_number: int
@@ -101,7 +113,7 @@ class InterruptInfo:
     rate: Optional[float] = None  # 中断率（次/秒）
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class SoftIRQInfo:
     """软中断信息"""
     cpu_id: int
@@ -113,7 +125,7 @@ class SoftIRQInfo:
     total_softirq: int
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class ContextSwitchInfo:
     """上下文切换信息"""
     pid: int
@@ -124,7 +136,7 @@ class ContextSwitchInfo:
     switch_rate: Optional[float] = None  # 切换率（次/秒）
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class InterruptMetrics:
     """中断相关指标"""
     # 硬中断统计
@@ -183,7 +195,7 @@ class InterruptMetrics:
         }
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class MetricsData:
     """Complete metrics data structure"""
     timestamp: str
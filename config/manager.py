@@ -3,14 +3,17 @@
 """
 Configuration classes and enums for load analyzer
 """
+import copy
 import os
 import json
 import yaml
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 
+from .._compat import DATACLASS_OPTIONS
+
 
 class OutputFormat(Enum):
     """Output format enumeration"""
@@ -21,9 +24,9 @@ class OutputFormat(Enum):
     MARKDOWN = "markdown"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class Config:
-    """Configuration for load analyzer"""
+    """Configuration for load analyzer (immutable, use dataclasses.replace to derive variants)"""
     # Sampling configuration
     sample_interval: int = 1
     sample_count: int = 1
@@ -106,11 +109,9 @@ class Config:
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary"""
         result = {}
-        for key, value in self.__dict__.items():
-            if isinstance(value, Enum):
-                result[key] = value.value
-            else:
-                result[key] = value
+        for key in _FIELD_NAMES:
+            value = getattr(self, key)
+            result[key] = value.value if key in _ENUM_FIELDS else value
         return result
     
     @classmethod
@@ -125,6 +126,14 @@ class Config:
         return cls(**config_data)
 
 
+# Config field names in declaration order; Enum-typed ones are serialized by value in to_dict
+_FIELD_NAMES = tuple(f.name for f in fields(Config))
+_ENUM_FIELDS = frozenset(
+    name for name, annotation in Config.__annotations__.items()
+    if isinstance(annotation, type) and issubclass(annotation, Enum)
+)
+
+
 class ConfigManager:
     """Configuration manager for loading and saving configurations"""
     
@@ -134,6 +143,9 @@ class ConfigManager:
         "/etc/load_analyzer/config.yaml"
     ]
     
+    # Parsed config files keyed by (absolute path, mtime in ns)
+    _CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    
     @staticmethod
     def load_config(config_file: Optional[str] = None) -> Config:
         """Load configuration from file or use defaults"""
@@ -170,7 +182,27 @@ class ConfigManager:
     
     @staticmethod
     def _load_config_file(config_path: str) -> Dict[str, Any]:
-        """Load configuration data from file"""
+        """Load configuration data from file, reusing the parsed data while the file is unchanged"""
+        abs_path = os.path.abspath(config_path)
+        key = (abs_path, os.stat(abs_path).st_mtime_ns)
+        
+        # Callers get deep copies, so nested sections of the cached data stay untouched
+        cached = ConfigManager._CACHE.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        config_data = ConfigManager._parse_config_file(config_path)
+        
+        # Drop entries for older versions of the same file
+        for stale_key in [k for k in ConfigManager._CACHE if k[0] == abs_path]:
+            del ConfigManager._CACHE[stale_key]
+        ConfigManager._CACHE[key] = config_data
+        
+        return copy.deepcopy(config_data)
+    
+    @staticmethod
+    def _parse_config_file(config_path: str) -> Dict[str, Any]:
+        """Parse configuration data from file"""
         path = Path(config_path)
         
         with open(config_path, 'r', encoding='utf-8') as f:
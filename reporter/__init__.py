@@ -2,6 +2,6 @@
 Reporter module for generating analysis reports
 """
 
-from .reporters import Reporter, TextReporter, JsonReporter, CsvReporter, HtmlReporter
+from .reporters import Reporter, TextReporter, JsonReporter, CsvReporter, HtmlReporter, get_reporter
 
-__all__ = ["Reporter", "TextReporter", "JsonReporter", "CsvReporter", "HtmlReporter"]
+__all__ = ["Reporter", "TextReporter", "JsonReporter", "CsvReporter", "HtmlReporter", "get_reporter"]
@@ -3,19 +3,97 @@
 """
 Base reporter interface and factory
 """
+import dataclasses
+import html
+import io
 import json
-import csv
-import sys
-from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Iterable, List, Mapping, TextIO, Tuple, Union
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from ..config import Config, OutputFormat
+from ..collector.models import MetricsData, ProcessInfo
+from ..analyzer.models import AnalysisResult, Issue, IssueSeverity, LoadStatus
+from .._compat import orjson
 
-from config import Config, OutputFormat
-from collector.models import MetricsData
-from analyzer.models import AnalysisResult
+# orjson indents natively and accepts int dict keys like the stdlib encoder,
+# which is kept as the fallback with the same layout
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Enum display strings, resolved once instead of through .value on every render
+_STATUS_LABELS = MappingProxyType({status: status.value.upper() for status in LoadStatus})
+_SEVERITY_LABELS = MappingProxyType({severity: severity.value.upper() for severity in IssueSeverity})
+_SEVERITY_CSS_CLASSES = MappingProxyType({severity: f"issue-{severity.value}" for severity in IssueSeverity})
+
+# ANSI palettes shared by all TextReporter instances (read-only views)
+_ANSI_COLORS = MappingProxyType({
+    'red': '\033[91m',
+    'yellow': '\033[93m',
+    'green': '\033[92m',
+    'blue': '\033[94m',
+    'magenta': '\033[95m',
+    'cyan': '\033[96m',
+    'white': '\033[97m',
+    'bold': '\033[1m',
+    'end': '\033[0m'
+})
+_NO_COLORS = MappingProxyType(dict.fromkeys(_ANSI_COLORS, ''))
+_ANSI_RESET = _ANSI_COLORS['end']
+
+# Color names by load status, and by how many thresholds (1x, 1.2x) a value exceeds
+_STATUS_COLORS = MappingProxyType({
+    'normal': 'green',
+    'elevated': 'yellow',
+    'high': 'yellow',
+    'critical': 'red'
+})
+_THRESHOLD_COLORS = ('green', 'yellow', 'red')
+
+# Issue section headers (the warning sign carries a U+FE0F emoji selector)
+_TEXT_CRITICAL_HEADER = "\U0001F6A8 CRITICAL ISSUES"
+_TEXT_HIGH_HEADER = "\u26A0\uFE0F  HIGH PRIORITY ISSUES"
+_TEXT_OTHER_HEADER = "\U0001F4CB OTHER ISSUES"
+_MD_CRITICAL_HEADER = "### \U0001F6A8 Critical Issues\n\n"
+_MD_HIGH_HEADER = "### \u26A0\uFE0F High Priority Issues\n\n"
+
+
+def _format_process_lines(processes: Iterable[ProcessInfo]) -> str:
+    """Format the two-line CPU/memory entries of the top process listing"""
+    return "".join([
+        f"    PID {proc.pid:5d} - {proc.name:15s}: CPU {proc.cpu_percent:5.1f}%, MEM {proc.memory_percent:5.1f}%\n"
+        f"      Command: {_truncate(proc.cmdline, 60)}\n"
+        for proc in processes
+    ])
+
+
+def _partition_issues(analysis: AnalysisResult) -> Tuple[List[Issue], List[Issue], List[Issue]]:
+    """Split all issues into critical, high and other lists in a single pass"""
+    critical, high, other = [], [], []
+    buckets = {IssueSeverity.CRITICAL: critical, IssueSeverity.HIGH: high}
+    for issue in analysis.get_all_issues():
+        buckets.get(issue.severity, other).append(issue)
+    return critical, high, other
+
+
+def _truncate(text: str, width: int) -> str:
+    """Cut text to width characters, marking the cut with an ellipsis"""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _format_core_usage(usage_per_core: List[float], threshold: float, colors: Mapping[str, str]) -> str:
+    """Format the per-core usage lines, colored against the CPU threshold"""
+    # Thresholds and color codes are resolved once for the whole block;
+    # the two comparisons sum to a palette index (0 green, 1 yellow, 2 red)
+    hot = threshold * 1.2
+    palette = tuple(colors[name] for name in _THRESHOLD_COLORS)
+    end = colors['end']
+    return "".join([
+        f"    Core {idx:2d}: {palette[(usage > threshold) + (usage > hot)]}{usage:5.1f}%{end}\n"
+        for idx, usage in enumerate(usage_per_core)
+    ])
 
 
 class BaseReporter(ABC):
@@ -28,287 +106,331 @@ class BaseReporter(ABC):
     def generate_report(self, metrics: MetricsData, analysis: AnalysisResult) -> str:
         """Generate report string"""
         pass
+    
+    def write_report(self, metrics: MetricsData, analysis: AnalysisResult, sink: TextIO) -> None:
+        """Write report to a text stream"""
+        sink.write(self.generate_report(metrics, analysis))
+    
+    def generate_report_bytes(self, metrics: MetricsData, analysis: AnalysisResult) -> bytes:
+        """Generate UTF-8 encoded report"""
+        return self.generate_report(metrics, analysis).encode('utf-8')
+    
+    @staticmethod
+    def _overview_fields(metrics: MetricsData) -> Dict[str, Any]:
+        """System overview values shared by the page templates"""
+        return {
+            'cpu_count': metrics.load.cpu_count,
+            'load1': metrics.load.load1,
+            'load5': metrics.load.load5,
+            'load15': metrics.load.load15,
+            'cpu_avg': metrics.cpu.avg_usage,
+            'memory_percent': metrics.memory.used_percent,
+            'iowait_percent': metrics.cpu.iowait_percent
+        }
+
+
+class _StreamingReporter(BaseReporter):
+    """Base class for reporters that write their output straight to a stream"""
+    
+    def generate_report(self, metrics: MetricsData, analysis: AnalysisResult) -> str:
+        """Generate report string through an in-memory stream"""
+        buf = io.StringIO()
+        self.write_report(metrics, analysis, buf)
+        return buf.getvalue()
+    
+    @abstractmethod
+    def write_report(self, metrics: MetricsData, analysis: AnalysisResult, sink: TextIO) -> None:
+        """Write report to a text stream"""
+        pass
 
 
 class Reporter:
     """Reporter factory and manager"""
     
+    # Buffer size for report files, large enough for a whole HTML/JSON report
+    WRITE_BUFFER_SIZE = 1 << 20
+    
     def __init__(self, config: Config):
         self.config = config
         self._reporter = self._create_reporter()
+        self._reporters: Dict[OutputFormat, BaseReporter] = {config.output_format: self._reporter}
     
     def _create_reporter(self) -> BaseReporter:
         """Create appropriate reporter based on config"""
-        if self.config.output_format == OutputFormat.JSON:
-            return JsonReporter(self.config)
-        elif self.config.output_format == OutputFormat.CSV:
-            return CsvReporter(self.config)
-        elif self.config.output_format == OutputFormat.HTML:
-            return HtmlReporter(self.config)
-        elif self.config.output_format == OutputFormat.MARKDOWN:
-            return MarkdownReporter(self.config)
-        else:
-            return TextReporter(self.config)
+        return get_reporter(self.config)
+    
+    def _reporter_for(self, output_format: OutputFormat) -> BaseReporter:
+        """Get (and cache) a reporter for another output format"""
+        reporter = self._reporters.get(output_format)
+        if reporter is None:
+            config = dataclasses.replace(self.config, output_format=output_format)
+            reporter = self._reporters[output_format] = get_reporter(config)
+        return reporter
     
     def generate_report(self, metrics: MetricsData, analysis: AnalysisResult) -> str:
         """Generate report using configured reporter"""
         return self._reporter.generate_report(metrics, analysis)
     
-    def save_report(self, report: str, filename: str) -> None:
-        """Save report to file"""
-        with open(filename, 'w', encoding='utf-8') as f:
+    def generate_reports(self, metrics: MetricsData, analysis: AnalysisResult,
+                         formats: Iterable[OutputFormat]) -> Dict[OutputFormat, str]:
+        """Generate the same snapshot in several output formats"""
+        reports = {}
+        # Each distinct format is rendered once, duplicates reuse the result
+        for output_format in dict.fromkeys(formats):
+            reports[output_format] = self._reporter_for(output_format).generate_report(metrics, analysis)
+        return reports
+    
+    def write_report(self, metrics: MetricsData, analysis: AnalysisResult, sink: TextIO) -> None:
+        """Write report to a text stream using configured reporter"""
+        self._reporter.write_report(metrics, analysis, sink)
+    
+    def generate_report_bytes(self, metrics: MetricsData, analysis: AnalysisResult) -> bytes:
+        """Generate UTF-8 encoded report using configured reporter"""
+        return self._reporter.generate_report_bytes(metrics, analysis)
+    
+    def save_report(self, report: Union[str, bytes], filename: str) -> None:
+        """Save report (text or already encoded bytes) to file"""
+        if isinstance(report, str):
+            report = report.encode('utf-8')
+        # Hand the bytes to a single write call
+        with open(filename, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
             f.write(report)
 
 
-class TextReporter(BaseReporter):
+class TextReporter(_StreamingReporter):
     """Text format reporter with ANSI colors"""
     
     def __init__(self, config: Config):
         super().__init__(config)
-        self.colors = {
-            'red': '\033[91m',
-            'yellow': '\033[93m', 
-            'green': '\033[92m',
-            'blue': '\033[94m',
-            'magenta': '\033[95m',
-            'cyan': '\033[96m',
-            'white': '\033[97m',
-            'bold': '\033[1m',
-            'end': '\033[0m'
-        } if config.enable_colors else {key: '' for key in ['red', 'yellow', 'green', 'blue', 'magenta', 'cyan', 'white', 'bold', 'end']}
+        self.colors = _ANSI_COLORS if config.enable_colors else _NO_COLORS
+        # Pick the colorizer once so the per-line hot path has no branch or lookups
+        if not config.enable_colors:
+            self.colorize = self._colorize_plain
     
     def colorize(self, text: str, color: str) -> str:
         """Apply color to text"""
-        return f"{self.colors.get(color, '')}{text}{self.colors.get('end', '')}"
+        return f"{_ANSI_COLORS.get(color, '')}{text}{_ANSI_RESET}"
     
-    def generate_report(self, metrics: MetricsData, analysis: AnalysisResult) -> str:
-        """Generate text report"""
-        lines = []
+    @staticmethod
+    def _colorize_plain(text: str, color: str) -> str:
+        """Return text unchanged when colors are disabled"""
+        return text
+    
+    def write_report(self, metrics: MetricsData, analysis: AnalysisResult, sink: TextIO) -> None:
+        """Write text report to a text stream"""
+        w = sink.write
         
         # Header
-        lines.append(self.colorize("=" * 60, "blue"))
-        lines.append(self.colorize("         SYSTEM LOAD ANALYSIS REPORT", "bold"))
-        lines.append(self.colorize("=" * 60, "blue"))
-        lines.append(f"Timestamp: {metrics.timestamp}")
-        lines.append("")
+        w(self.colorize("=" * 60, "blue") + "\n")
+        w(self.colorize("         SYSTEM LOAD ANALYSIS REPORT", "bold") + "\n")
+        w(self.colorize("=" * 60, "blue") + "\n")
+        w(f"Timestamp: {metrics.timestamp}\n")
+        w("\n")
         
         # Status overview
         status_color = self._get_status_color(analysis.load_status.value)
-        lines.append(self.colorize(f"Load Status: {analysis.load_status.value.upper()}", status_color))
-        lines.append("")
+        w(self.colorize(f"Load Status: {_STATUS_LABELS[analysis.load_status]}", status_color) + "\n")
+        w("\n")
         
         # System overview
-        lines.append(self.colorize("SYSTEM OVERVIEW", "bold"))
-        lines.append(f"  CPU Cores: {metrics.load.cpu_count}")
-        lines.append(f"  Load Averages: {metrics.load.load1:.2f} / {metrics.load.load5:.2f} / {metrics.load.load15:.2f}")
-        lines.append(f"  CPU Usage: {self.colorize(f'{metrics.cpu.avg_usage:.1f}%', self._get_threshold_color(metrics.cpu.avg_usage, self.config.cpu_threshold))}")
-        lines.append(f"  Memory Usage: {self.colorize(f'{metrics.memory.used_percent:.1f}%', self._get_threshold_color(metrics.memory.used_percent, self.config.memory_threshold))}")
-        lines.append(f"  I/O Wait: {self.colorize(f'{metrics.cpu.iowait_percent:.1f}%', self._get_threshold_color(metrics.cpu.iowait_percent, self.config.iowait_threshold))}")
-        lines.append("")
+        w(self.colorize("SYSTEM OVERVIEW", "bold") + "\n")
+        w(f"  CPU Cores: {metrics.load.cpu_count}\n")
+        w(f"  Load Averages: {metrics.load.load1:.2f} / {metrics.load.load5:.2f} / {metrics.load.load15:.2f}\n")
+        w(f"  CPU Usage: {self.colorize(f'{metrics.cpu.avg_usage:.1f}%', self._get_threshold_color(metrics.cpu.avg_usage, self.config.cpu_threshold))}\n")
+        w(f"  Memory Usage: {self.colorize(f'{metrics.memory.used_percent:.1f}%', self._get_threshold_color(metrics.memory.used_percent, self.config.memory_threshold))}\n")
+        w(f"  I/O Wait: {self.colorize(f'{metrics.cpu.iowait_percent:.1f}%', self._get_threshold_color(metrics.cpu.iowait_percent, self.config.iowait_threshold))}\n")
+        w("\n")
         
         # Critical and High Issues
-        if analysis.get_critical_issues():
-            lines.append(self.colorize("🚨 CRITICAL ISSUES", "red"))
-            for issue in analysis.get_critical_issues():
-                lines.append(f"  • {self.colorize(issue.message, 'red')}")
-                if issue.related_processes:
-                    lines.append(f"    Top processes: {', '.join([f'{p.name}({p.pid})' for p in issue.related_processes[:3]])}")
-            lines.append("")
-        
-        if analysis.get_high_issues():
-            lines.append(self.colorize("⚠️  HIGH PRIORITY ISSUES", "yellow"))
-            for issue in analysis.get_high_issues():
-                lines.append(f"  • {self.colorize(issue.message, 'yellow')}")
-                if issue.related_processes:
-                    lines.append(f"    Top processes: {', '.join([f'{p.name}({p.pid})' for p in issue.related_processes[:3]])}")
-            lines.append("")
+        critical_issues, high_issues, other_issues = _partition_issues(analysis)
+        if critical_issues:
+            self._write_issue_section(_TEXT_CRITICAL_HEADER, critical_issues, "red", w)
+        
+        if high_issues:
+            self._write_issue_section(_TEXT_HIGH_HEADER, high_issues, "yellow", w)
         
         # All other issues
-        other_issues = [i for i in analysis.get_all_issues() 
-                       if i.severity.value not in ['critical', 'high']]
         if other_issues:
-            lines.append(self.colorize("📋 OTHER ISSUES", "cyan"))
+            w(self.colorize(_TEXT_OTHER_HEADER, "cyan") + "\n")
             for issue in other_issues:
-                lines.append(f"  • {issue.message}")
-            lines.append("")
+                w(f"  • {issue.message}\n")
+            w("\n")
         
         # CPU Details
-        lines.append(self.colorize("CPU ANALYSIS", "blue"))
-        lines.append(f"  Average Usage: {metrics.cpu.avg_usage:.1f}%")
-        lines.append(f"  I/O Wait: {metrics.cpu.iowait_percent:.1f}%")
-        lines.append(f"  Context Switches: {metrics.cpu.context_switches:,}")
-        lines.append(f"  Interrupts: {metrics.cpu.interrupts:,}")
-        lines.append("  Per-Core Usage:")
-        for idx, usage in enumerate(metrics.cpu.usage_per_core):
-            color = self._get_threshold_color(usage, self.config.cpu_threshold)
-            lines.append(f"    Core {idx:2d}: {self.colorize(f'{usage:5.1f}%', color)}")
-        lines.append("")
+        w(self.colorize("CPU ANALYSIS", "blue") + "\n")
+        w(f"  Average Usage: {metrics.cpu.avg_usage:.1f}%\n")
+        w(f"  I/O Wait: {metrics.cpu.iowait_percent:.1f}%\n")
+        w(f"  Context Switches: {metrics.cpu.context_switches:,}\n")
+        w(f"  Interrupts: {metrics.cpu.interrupts:,}\n")
+        w("  Per-Core Usage:\n")
+        w(_format_core_usage(metrics.cpu.usage_per_core, self.config.cpu_threshold, self.colors))
+        w("\n")
         
         # Memory Details
-        lines.append(self.colorize("MEMORY ANALYSIS", "blue"))
-        lines.append(f"  Total: {metrics.memory.total_gb:.2f} GB")
-        lines.append(f"  Used: {self.colorize(f'{metrics.memory.used_percent:.1f}%', self._get_threshold_color(metrics.memory.used_percent, self.config.memory_threshold))}")
-        lines.append(f"  Available: {metrics.memory.available_gb:.2f} GB")
-        lines.append(f"  Buffers: {metrics.memory.buffers_gb:.2f} GB")
-        lines.append(f"  Cached: {metrics.memory.cached_gb:.2f} GB")
-        lines.append(f"  Swap: {self.colorize(f'{metrics.memory.swap_percent:.1f}%', self._get_threshold_color(metrics.memory.swap_percent, self.config.swap_threshold))} of {metrics.memory.swap_total_gb:.2f} GB")
-        lines.append("")
+        w(self.colorize("MEMORY ANALYSIS", "blue") + "\n")
+        w(f"  Total: {metrics.memory.total_gb:.2f} GB\n")
+        w(f"  Used: {self.colorize(f'{metrics.memory.used_percent:.1f}%', self._get_threshold_color(metrics.memory.used_percent, self.config.memory_threshold))}\n")
+        w(f"  Available: {metrics.memory.available_gb:.2f} GB\n")
+        w(f"  Buffers: {metrics.memory.buffers_gb:.2f} GB\n")
+        w(f"  Cached: {metrics.memory.cached_gb:.2f} GB\n")
+        w(f"  Swap: {self.colorize(f'{metrics.memory.swap_percent:.1f}%', self._get_threshold_color(metrics.memory.swap_percent, self.config.swap_threshold))} of {metrics.memory.swap_total_gb:.2f} GB\n")
+        w("\n")
         
         # Disk I/O
-        lines.append(self.colorize("DISK I/O ANALYSIS", "blue"))
-        lines.append(f"  Read: {metrics.disk_io.read_count:,} ops, {self._format_bytes(metrics.disk_io.read_bytes)}")
-        lines.append(f"  Write: {metrics.disk_io.write_count:,} ops, {self._format_bytes(metrics.disk_io.write_bytes)}")
+        w(self.colorize("DISK I/O ANALYSIS", "blue") + "\n")
+        w(f"  Read: {metrics.disk_io.read_count:,} ops, {self._format_bytes(metrics.disk_io.read_bytes)}\n")
+        w(f"  Write: {metrics.disk_io.write_count:,} ops, {self._format_bytes(metrics.disk_io.write_bytes)}\n")
         if metrics.disk_io.read_rate:
-            lines.append(f"  Read Rate: {self._format_bytes(metrics.disk_io.read_rate)}/s")
+            w(f"  Read Rate: {self._format_bytes(metrics.disk_io.read_rate)}/s\n")
         if metrics.disk_io.write_rate:
-            lines.append(f"  Write Rate: {self._format_bytes(metrics.disk_io.write_rate)}/s")
-        lines.append("")
+            w(f"  Write Rate: {self._format_bytes(metrics.disk_io.write_rate)}/s\n")
+        w("\n")
         
         # Network
-        lines.append(self.colorize("NETWORK ANALYSIS", "blue"))
-        lines.append(f"  Total Connections: {self.colorize(str(metrics.network.total_connections), self._get_threshold_color(metrics.network.total_connections, self.config.tcp_connections_threshold))}")
-        lines.append(f"  Bytes Sent: {self._format_bytes(metrics.network.bytes_sent)}")
-        lines.append(f"  Bytes Received: {self._format_bytes(metrics.network.bytes_recv)}")
+        w(self.colorize("NETWORK ANALYSIS", "blue") + "\n")
+        w(f"  Total Connections: {self.colorize(str(metrics.network.total_connections), self._get_threshold_color(metrics.network.total_connections, self.config.tcp_connections_threshold))}\n")
+        w(f"  Bytes Sent: {self._format_bytes(metrics.network.bytes_sent)}\n")
+        w(f"  Bytes Received: {self._format_bytes(metrics.network.bytes_recv)}\n")
         
         if isinstance(metrics.network.tcp_connections, dict):
-            lines.append("  TCP Connection States:")
+            w("  TCP Connection States:\n")
             for state, count in sorted(metrics.network.tcp_connections.items()):
-                lines.append(f"    {state}: {count}")
-        lines.append("")
+                w(f"    {state}: {count}\n")
+        w("\n")
         
         # Interrupt Analysis
         if metrics.interrupts and self.config.enable_interrupt_analysis:
-            lines.extend(self._generate_interrupt_report(metrics.interrupts))
+            self._write_interrupt_report(metrics.interrupts, w)
         
         # Top Processes
-        lines.append(self.colorize("TOP PROCESSES", "blue"))
+        w(self.colorize("TOP PROCESSES", "blue") + "\n")
+        top_processes = metrics.top_processes
+        top_by_io = top_processes.get('by_io')
         
         # Top CPU processes
-        lines.append(self.colorize("  By CPU Usage:", "cyan"))
-        for proc in metrics.top_processes.get('by_cpu', [])[:5]:
-            lines.append(f"    PID {proc.pid:5d} - {proc.name:15s}: CPU {proc.cpu_percent:5.1f}%, MEM {proc.memory_percent:5.1f}%")
-            lines.append(f"      Command: {proc.cmdline[:60]}{'...' if len(proc.cmdline) > 60 else ''}")
-        
-        lines.append(self.colorize("  By Memory Usage:", "cyan"))
-        for proc in metrics.top_processes.get('by_memory', [])[:5]:
-            lines.append(f"    PID {proc.pid:5d} - {proc.name:15s}: CPU {proc.cpu_percent:5.1f}%, MEM {proc.memory_percent:5.1f}%")
-            lines.append(f"      Command: {proc.cmdline[:60]}{'...' if len(proc.cmdline) > 60 else ''}")
-        
-        if metrics.top_processes.get('by_io'):
-            lines.append(self.colorize("  By I/O Activity:", "cyan"))
-            for proc in metrics.top_processes.get('by_io', [])[:5]:
+        w(self.colorize("  By CPU Usage:", "cyan") + "\n")
+        w(_format_process_lines(top_processes.get('by_cpu', [])[:5]))
+        
+        w(self.colorize("  By Memory Usage:", "cyan") + "\n")
+        w(_format_process_lines(top_processes.get('by_memory', [])[:5]))
+        
+        if top_by_io:
+            w(self.colorize("  By I/O Activity:", "cyan") + "\n")
+            for proc in top_by_io[:5]:
                 io_info = proc.io_counters
                 if io_info:
                     total_io = self._format_bytes(io_info.get('total_bytes', 0))
-                    lines.append(f"    PID {proc.pid:5d} - {proc.name:15s}: Total I/O {total_io}")
+                    w(f"    PID {proc.pid:5d} - {proc.name:15s}: Total I/O {total_io}\n")
         
-        lines.append("")
+        w("\n")
         
         # Recommendations
         if analysis.recommendations:
-            lines.append(self.colorize("RECOMMENDATIONS", "green"))
-            for i, rec in enumerate(analysis.recommendations, 1):
-                lines.append(f"  {i}. {rec}")
-            lines.append("")
+            w(self.colorize("RECOMMENDATIONS", "green") + "\n")
+            w("".join([f"  {i}. {rec}\n" for i, rec in enumerate(analysis.recommendations, 1)]))
+            w("\n")
         
         # Summary
-        lines.append(self.colorize("SUMMARY", "bold"))
-        lines.append(f"  Total Issues: {analysis.summary.get('total_issues', 0)}")
-        lines.append(f"  Critical Issues: {analysis.summary.get('critical_issues', 0)}")
-        lines.append(f"  High Issues: {analysis.summary.get('high_issues', 0)}")
-        lines.append(f"  Load Ratio: {analysis.summary.get('load_ratio', 0):.2f}")
-        
-        return "\n".join(lines)
+        w(self.colorize("SUMMARY", "bold") + "\n")
+        summary_get = analysis.summary.get
+        w(f"  Total Issues: {summary_get('total_issues', 0)}\n")
+        w(f"  Critical Issues: {summary_get('critical_issues', 0)}\n")
+        w(f"  High Issues: {summary_get('high_issues', 0)}\n")
+        w(f"  Load Ratio: {summary_get('load_ratio', 0):.2f}")
     
     def _get_status_color(self, status: str) -> str:
         """Get color for load status"""
-        status_colors = {
-            'normal': 'green',
-            'elevated': 'yellow',
-            'high': 'yellow',
-            'critical': 'red'
-        }
-        return status_colors.get(status.lower(), 'white')
+        return _STATUS_COLORS.get(status.lower(), 'white')
     
     def _get_threshold_color(self, value: float, threshold: float) -> str:
         """Get color based on threshold"""
-        if value > threshold * 1.2:
-            return 'red'
-        elif value > threshold:
-            return 'yellow'
-        else:
-            return 'green'
+        return _THRESHOLD_COLORS[(value > threshold) + (value > threshold * 1.2)]
     
-    def _generate_interrupt_report(self, interrupts) -> List[str]:
-        """生成中断分析报告"""
-        lines = []
-        
-        lines.append(self.colorize("INTERRUPT & CONTEXT SWITCH ANALYSIS", "blue"))
+    def _write_issue_section(self, title: str, issues: List[Issue], color: str,
+                             w: Callable[[str], Any]) -> None:
+        """Write a colored issue section with related processes"""
+        w(self.colorize(title, color) + "\n")
+        # Resolve the color codes once for the whole section
+        color_on, color_off = self.colors[color], self.colors['end']
+        for issue in issues:
+            w(f"  • {color_on}{issue.message}{color_off}\n")
+            related = issue.related_processes
+            if related:
+                w(f"    Top processes: {', '.join([f'{p.name}({p.pid})' for p in related[:3]])}\n")
+        w("\n")
+    
+    def _write_interrupt_report(self, interrupts, w: Callable[[str], Any]) -> None:
+        """生成中断分析报告，写入w"""
+        w(self.colorize("INTERRUPT & CONTEXT SWITCH ANALYSIS", "blue") + "\n")
         
         # 硬中断统计
-        lines.append(f"  Total Interrupts: {interrupts.total_interrupts:,}")
+        w(f"  Total Interrupts: {interrupts.total_interrupts:,}\n")
         if interrupts.interrupt_rate:
             rate_color = self._get_threshold_color(interrupts.interrupt_rate, self.config.max_interrupt_rate)
-            lines.append(f"  Interrupt Rate: {self.colorize(f'{interrupts.interrupt_rate:.0f}/sec', rate_color)}")
+            w(f"  Interrupt Rate: {self.colorize(f'{interrupts.interrupt_rate:.0f}/sec', rate_color)}\n")
         
         # CPU中断分布
         if interrupts.cpu_interrupt_distribution:
-            lines.append(f"  Hottest CPU: Core {interrupts.hottest_cpu}")
-            lines.append("  CPU Interrupt Distribution:")
+            w(f"  Hottest CPU: Core {interrupts.hottest_cpu}\n")
+            w("  CPU Interrupt Distribution:\n")
+            hottest_cpu = interrupts.hottest_cpu
+            colors = self.colors
+            red, white, end = colors['red'], colors['white'], colors['end']
             for idx, count in enumerate(interrupts.cpu_interrupt_distribution):
                 if count > 0:
-                    is_hottest = idx == interrupts.hottest_cpu
-                    color = 'red' if is_hottest else 'white'
+                    is_hottest = idx == hottest_cpu
+                    color = red if is_hottest else white
                     marker = '→' if is_hottest else ' '
-                    lines.append(f"    {marker} Core {idx:2d}: {self.colorize(f'{count:,}', color)}")
+                    w(f"    {marker} Core {idx:2d}: {color}{count:,}{end}\n")
         
         # 网卡中断热点
         if interrupts.network_interrupts:
-            lines.append(self.colorize("  Network Interrupts:", "cyan"))
+            w(self.colorize("  Network Interrupts:", "cyan") + "\n")
             for net_int in interrupts.network_interrupts[:5]:  # 显示前5个
                 rate_str = f" ({net_int.rate:.0f}/sec)" if net_int.rate else ""
-                lines.append(f"    IRQ {net_int.irq_number:3d} - {net_int.device_name}: {net_int.interrupt_count:,}{rate_str}")
+                w(f"    IRQ {net_int.irq_number:3d} - {net_int.device_name}: {net_int.interrupt_count:,}{rate_str}\n")
                 
                 # 显示中断分布
                 if net_int.cpu_distribution:
                     dist_str = ", ".join([f"CPU{i}:{count}" for i, count in enumerate(net_int.cpu_distribution) if count > 0])
                     if len(dist_str) > 60:
                         dist_str = dist_str[:57] + "..."
-                    lines.append(f"      Distribution: {dist_str}")
+                    w(f"      Distribution: {dist_str}\n")
         
         # ksoftirqd进程状态
         if interrupts.ksoftirqd_processes:
-            lines.append(self.colorize("  Software Interrupt Processes:", "cyan"))
+            w(self.colorize("  Software Interrupt Processes:", "cyan") + "\n")
             for softirq in interrupts.ksoftirqd_processes:
                 cpu_color = self._get_threshold_color(softirq.cpu_percent, self.config.ksoftirqd_cpu_threshold)
-                lines.append(f"    ksoftirqd/{softirq.cpu_id} (PID {softirq.ksoftirqd_pid}): {self.colorize(f'{softirq.cpu_percent:.1f}%', cpu_color)} CPU")
+                w(f"    ksoftirqd/{softirq.cpu_id} (PID {softirq.ksoftirqd_pid}): {self.colorize(f'{softirq.cpu_percent:.1f}%', cpu_color)} CPU\n")
                 if softirq.net_rx or softirq.net_tx:
-                    lines.append(f"      NET_RX: {softirq.net_rx:,}, NET_TX: {softirq.net_tx:,}")
+                    w(f"      NET_RX: {softirq.net_rx:,}, NET_TX: {softirq.net_tx:,}\n")
         
         # 上下文切换
-        lines.append(f"  Context Switches: {interrupts.system_context_switches:,}")
+        w(f"  Context Switches: {interrupts.system_context_switches:,}\n")
         if interrupts.context_switch_rate:
             rate_color = self._get_threshold_color(interrupts.context_switch_rate, self.config.max_context_switch_rate)
-            lines.append(f"  Context Switch Rate: {self.colorize(f'{interrupts.context_switch_rate:.0f}/sec', rate_color)}")
+            w(f"  Context Switch Rate: {self.colorize(f'{interrupts.context_switch_rate:.0f}/sec', rate_color)}\n")
         
         # 高上下文切换进程
         if interrupts.high_switch_processes:
-            lines.append(self.colorize("  High Context Switch Processes:", "cyan"))
+            w(self.colorize("  High Context Switch Processes:", "cyan") + "\n")
             for proc_cs in interrupts.high_switch_processes[:5]:  # 显示前5个
                 rate_str = f" ({proc_cs.switch_rate:.0f}/sec)" if proc_cs.switch_rate else ""
-                lines.append(f"    PID {proc_cs.pid:5d} - {proc_cs.name}: {proc_cs.total_switches:,} switches{rate_str}")
-                lines.append(f"      Voluntary: {proc_cs.voluntary_switches:,}, Non-voluntary: {proc_cs.nonvoluntary_switches:,}")
+                w(f"    PID {proc_cs.pid:5d} - {proc_cs.name}: {proc_cs.total_switches:,} switches{rate_str}\n")
+                w(f"      Voluntary: {proc_cs.voluntary_switches:,}, Non-voluntary: {proc_cs.nonvoluntary_switches:,}\n")
         
-        lines.append("")
-        return lines
+        w("\n")
     
-    def _format_bytes(self, bytes_value: float) -> str:
+    @staticmethod
+    def _format_bytes(bytes_value: float) -> str:
         """Format bytes in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
+        if bytes_value < 1024.0:
+            return f"{bytes_value:.1f} B"
+        # Each unit is 2**10 of the previous one, so the integer bit length picks the unit
+        # directly (exact, unlike float log2 just below a unit boundary)
+        idx = min((int(bytes_value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes_value / (1 << (idx * 10)):.1f} {_BYTE_UNITS[idx]}"
 
 
 class JsonReporter(BaseReporter):
@@ -316,193 +438,272 @@ class JsonReporter(BaseReporter):
     
     def generate_report(self, metrics: MetricsData, analysis: AnalysisResult) -> str:
         """Generate JSON report"""
-        report_data = {
+        report_data = self._build_report_data(metrics, analysis)
+        if orjson is not None:
+            return orjson.dumps(report_data, option=_ORJSON_OPTIONS).decode('utf-8')
+        return _JSON_ENCODER.encode(report_data)
+    
+    def generate_report_bytes(self, metrics: MetricsData, analysis: AnalysisResult) -> bytes:
+        """Generate UTF-8 encoded JSON report"""
+        report_data = self._build_report_data(metrics, analysis)
+        if orjson is not None:
+            # orjson already produces UTF-8 bytes, skip the decode/encode round trip
+            return orjson.dumps(report_data, option=_ORJSON_OPTIONS)
+        return _JSON_ENCODER.encode(report_data).encode('utf-8')
+    
+    def write_report(self, metrics: MetricsData, analysis: AnalysisResult, sink: TextIO) -> None:
+        """Write JSON report to a text stream (incremental only on the json fallback,
+        orjson encodes the whole document before a single write)"""
+        if orjson is not None:
+            sink.write(self.generate_report(metrics, analysis))
+            return
+        
+        # Stream encoder chunks instead of materializing the whole document
+        for chunk in _JSON_ENCODER.iterencode(self._build_report_data(metrics, analysis)):
+            sink.write(chunk)
+    
+    def _build_report_data(self, metrics: MetricsData, analysis: AnalysisResult) -> Dict[str, Any]:
+        """Build the report payload"""
+        # Both encoders get the same plain dicts, so the layout does not depend on orjson
+        return {
             'metrics': metrics.to_dict(),
             'analysis': analysis.to_dict()
         }
-        return json.dumps(report_data, indent=2, ensure_ascii=False)
+
+
+# Same dialect as csv.writer's default (excel): minimal quoting, CRLF rows
+_CSV_FIELDNAMES = (
+    'timestamp', 'load_status', 'load1', 'load5', 'load15', 'cpu_avg',
+    'memory_percent', 'swap_percent', 'iowait_percent', 'tcp_connections',
+    'total_issues', 'critical_issues', 'high_issues',
+    'top_cpu_process', 'top_memory_process'
+)
+_CSV_HEADER = ",".join(_CSV_FIELDNAMES) + "\r\n"
+_CSV_SPECIAL = frozenset(',"\r\n')
+
+
+def _csv_field(value: Any) -> str:
+    """Format a single CSV field, quoting only when needed"""
+    if value is None:
+        return ''
+    text = str(value)
+    if _CSV_SPECIAL.isdisjoint(text):
+        return text
+    return '"' + text.replace('"', '""') + '"'
 
 
 class CsvReporter(BaseReporter):
     """CSV format reporter"""
     
+    def __init__(self, config: Config):
+        super().__init__(config)
+        self._header_sink = None
+    
     def generate_report(self, metrics: MetricsData, analysis: AnalysisResult) -> str:
         """Generate CSV report"""
-        import io
-        output = io.StringIO()
-        
-        # Write header
-        fieldnames = [
-            'timestamp', 'load_status', 'load1', 'load5', 'load15', 'cpu_avg',
-            'memory_percent', 'swap_percent', 'iowait_percent', 'tcp_connections',
-            'total_issues', 'critical_issues', 'high_issues',
-            'top_cpu_process', 'top_memory_process'
-        ]
-        
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        # Write data row
-        row = {
-            'timestamp': metrics.timestamp,
-            'load_status': analysis.load_status.value,
-            'load1': metrics.load.load1,
-            'load5': metrics.load.load5,
-            'load15': metrics.load.load15,
-            'cpu_avg': metrics.cpu.avg_usage,
-            'memory_percent': metrics.memory.used_percent,
-            'swap_percent': metrics.memory.swap_percent,
-            'iowait_percent': metrics.cpu.iowait_percent,
-            'tcp_connections': metrics.network.total_connections,
-            'total_issues': analysis.summary.get('total_issues', 0),
-            'critical_issues': analysis.summary.get('critical_issues', 0),
-            'high_issues': analysis.summary.get('high_issues', 0),
-            'top_cpu_process': analysis.summary.get('top_cpu_process', ''),
-            'top_memory_process': analysis.summary.get('top_memory_process', '')
-        }
-        
-        writer.writerow(row)
-        return output.getvalue()
+        return _CSV_HEADER + self._format_row(metrics, analysis)
+    
+    def append_row(self, metrics: MetricsData, analysis: AnalysisResult, sink: TextIO) -> None:
+        """Append one sample row to an open CSV stream, writing the header once per stream"""
+        if sink is not self._header_sink:
+            sink.write(_CSV_HEADER)
+            self._header_sink = sink
+        sink.write(self._format_row(metrics, analysis))
+    
+    def _format_row(self, metrics: MetricsData, analysis: AnalysisResult) -> str:
+        """Format a single CSV data row"""
+        summary_get = analysis.summary.get
+        load = metrics.load
+        # Numeric and enum fields never need quoting, only free text goes through _csv_field
+        return (
+            f"{_csv_field(metrics.timestamp)},{analysis.load_status.value},"
+            f"{load.load1},{load.load5},{load.load15},{metrics.cpu.avg_usage},"
+            f"{metrics.memory.used_percent},{metrics.memory.swap_percent},"
+            f"{metrics.cpu.iowait_percent},{metrics.network.total_connections},"
+            f"{summary_get('total_issues', 0)},{summary_get('critical_issues', 0)},"
+            f"{summary_get('high_issues', 0)},"
+            f"{_csv_field(summary_get('top_cpu_process'))},"
+            f"{_csv_field(summary_get('top_memory_process'))}\r\n"
+        )
 
 
-class HtmlReporter(BaseReporter):
-    """HTML format reporter"""
-    
-    def generate_report(self, metrics: MetricsData, analysis: AnalysisResult) -> str:
-        """Generate HTML report"""
-        html = f"""
+# Static page fragments, only the overview blocks take str.format fields
+_HTML_HEAD = """
 <!DOCTYPE html>
 <html>
 <head>
     <title>System Load Analysis Report</title>
     <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ color: #2c3e50; border-bottom: 2px solid #3498db; }}
-        .status-normal {{ color: #27ae60; }}
-        .status-elevated {{ color: #f39c12; }}
-        .status-high {{ color: #e67e22; }}
-        .status-critical {{ color: #e74c3c; }}
-        .issue-critical {{ background-color: #ffebee; border-left: 4px solid #e74c3c; padding: 10px; }}
-        .issue-high {{ background-color: #fff8e1; border-left: 4px solid #ff9800; padding: 10px; }}
-        .issue-medium {{ background-color: #f3e5f5; border-left: 4px solid #9c27b0; padding: 10px; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-        .metric {{ display: inline-block; margin: 10px; padding: 10px; border: 1px solid #ddd; }}
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { color: #2c3e50; border-bottom: 2px solid #3498db; }
+        .status-normal { color: #27ae60; }
+        .status-elevated { color: #f39c12; }
+        .status-high { color: #e67e22; }
+        .status-critical { color: #e74c3c; }
+        .issue-critical { background-color: #ffebee; border-left: 4px solid #e74c3c; padding: 10px; }
+        .issue-high { background-color: #fff8e1; border-left: 4px solid #ff9800; padding: 10px; }
+        .issue-medium { background-color: #f3e5f5; border-left: 4px solid #9c27b0; padding: 10px; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        .metric { display: inline-block; margin: 10px; padding: 10px; border: 1px solid #ddd; }
     </style>
 </head>
 <body>
-    <h1 class="header">System Load Analysis Report</h1>
-    <p><strong>Timestamp:</strong> {metrics.timestamp}</p>
-    <p><strong>Load Status:</strong> <span class="status-{analysis.load_status.value}">{analysis.load_status.value.upper()}</span></p>
+"""
+_HTML_OVERVIEW = """    <h1 class="header">System Load Analysis Report</h1>
+    <p><strong>Timestamp:</strong> {timestamp}</p>
+    <p><strong>Load Status:</strong> <span class="status-{status}">{status_label}</span></p>
     
     <h2>System Overview</h2>
     <div class="metric">
-        <strong>CPU Cores:</strong> {metrics.load.cpu_count}
+        <strong>CPU Cores:</strong> {cpu_count}
     </div>
     <div class="metric">
-        <strong>Load Averages:</strong> {metrics.load.load1:.2f} / {metrics.load.load5:.2f} / {metrics.load.load15:.2f}
+        <strong>Load Averages:</strong> {load1:.2f} / {load5:.2f} / {load15:.2f}
     </div>
     <div class="metric">
-        <strong>CPU Usage:</strong> {metrics.cpu.avg_usage:.1f}%
+        <strong>CPU Usage:</strong> {cpu_avg:.1f}%
     </div>
     <div class="metric">
-        <strong>Memory Usage:</strong> {metrics.memory.used_percent:.1f}%
+        <strong>Memory Usage:</strong> {memory_percent:.1f}%
     </div>
     <div class="metric">
-        <strong>I/O Wait:</strong> {metrics.cpu.iowait_percent:.1f}%
+        <strong>I/O Wait:</strong> {iowait_percent:.1f}%
     </div>
     
     <h2>Issues</h2>
 """
-        
-        # Add issues
-        for issue in analysis.get_all_issues():
-            severity_class = f"issue-{issue.severity.value}"
-            html += f'<div class="{severity_class}"><strong>{issue.severity.value.upper()}:</strong> {issue.message}</div>\n'
-        
-        # Add top processes table
-        html += """
+_HTML_PROCESS_TABLE_HEAD = """
     <h2>Top Processes by CPU</h2>
     <table>
         <tr><th>PID</th><th>Name</th><th>CPU %</th><th>Memory %</th><th>Command</th></tr>
 """
-        
-        for proc in metrics.top_processes.get('by_cpu', [])[:10]:
-            html += f"<tr><td>{proc.pid}</td><td>{proc.name}</td><td>{proc.cpu_percent:.1f}%</td><td>{proc.memory_percent:.1f}%</td><td>{proc.cmdline[:50]}...</td></tr>\n"
-        
-        html += """
+_HTML_RECOMMENDATIONS_HEAD = """
     </table>
     
     <h2>Recommendations</h2>
     <ul>
 """
-        
-        for rec in analysis.recommendations:
-            html += f"<li>{rec}</li>\n"
-        
-        html += """
+_HTML_TAIL = """
     </ul>
 </body>
 </html>
 """
-        return html
+_MD_OVERVIEW = """# System Load Analysis Report
 
-
-class MarkdownReporter(BaseReporter):
-    """Markdown format reporter"""
-    
-    def generate_report(self, metrics: MetricsData, analysis: AnalysisResult) -> str:
-        """Generate Markdown report"""
-        md = f"""# System Load Analysis Report
-
-**Timestamp:** {metrics.timestamp}  
-**Load Status:** {analysis.load_status.value.upper()}
+**Timestamp:** {timestamp}  
+**Load Status:** {status_label}
 
 ## System Overview
 
 | Metric | Value |
 |--------|-------|
-| CPU Cores | {metrics.load.cpu_count} |
-| Load Averages | {metrics.load.load1:.2f} / {metrics.load.load5:.2f} / {metrics.load.load15:.2f} |
-| CPU Usage | {metrics.cpu.avg_usage:.1f}% |
-| Memory Usage | {metrics.memory.used_percent:.1f}% |
-| I/O Wait | {metrics.cpu.iowait_percent:.1f}% |
+| CPU Cores | {cpu_count} |
+| Load Averages | {load1:.2f} / {load5:.2f} / {load15:.2f} |
+| CPU Usage | {cpu_avg:.1f}% |
+| Memory Usage | {memory_percent:.1f}% |
+| I/O Wait | {iowait_percent:.1f}% |
 
 ## Issues
 
 """
+_MD_PROCESS_TABLE_HEAD = ("\n## Top Processes by CPU\n\n"
+                          "| PID | Name | CPU % | Memory % | Command |\n"
+                          "|-----|------|-------|----------|----------|\n")
+
+
+class HtmlReporter(_StreamingReporter):
+    """HTML format reporter"""
+    
+    def write_report(self, metrics: MetricsData, analysis: AnalysisResult, sink: TextIO) -> None:
+        """Write HTML report to a text stream"""
+        w = sink.write
+        w(_HTML_HEAD)
+        w(_HTML_OVERVIEW.format(
+            timestamp=metrics.timestamp,
+            status=analysis.load_status.value,
+            status_label=_STATUS_LABELS[analysis.load_status],
+            **self._overview_fields(metrics)
+        ))
+        
+        # Free text (messages, process names, command lines) is escaped, markup is not
+        escape = html.escape
+        
+        # Add issues
+        for issue in analysis.get_all_issues():
+            severity = issue.severity
+            w(f'<div class="{_SEVERITY_CSS_CLASSES[severity]}"><strong>{_SEVERITY_LABELS[severity]}:</strong> '
+              f'{escape(issue.message, quote=False)}</div>\n')
+        
+        # Add top processes table
+        w(_HTML_PROCESS_TABLE_HEAD)
+        
+        for proc in metrics.top_processes.get('by_cpu', [])[:10]:
+            w(f"<tr><td>{proc.pid}</td><td>{escape(proc.name, quote=False)}</td><td>{proc.cpu_percent:.1f}%</td>"
+              f"<td>{proc.memory_percent:.1f}%</td><td>{escape(_truncate(proc.cmdline, 50), quote=False)}</td></tr>\n")
+        
+        w(_HTML_RECOMMENDATIONS_HEAD)
+        
+        for rec in analysis.recommendations:
+            w(f"<li>{escape(rec, quote=False)}</li>\n")
+        
+        w(_HTML_TAIL)
+
+
+class MarkdownReporter(_StreamingReporter):
+    """Markdown format reporter"""
+    
+    def write_report(self, metrics: MetricsData, analysis: AnalysisResult, sink: TextIO) -> None:
+        """Write Markdown report to a text stream"""
+        w = sink.write
+        w(_MD_OVERVIEW.format(
+            timestamp=metrics.timestamp,
+            status_label=_STATUS_LABELS[analysis.load_status],
+            **self._overview_fields(metrics)
+        ))
         
         # Add issues
-        if analysis.get_critical_issues():
-            md += "### 🚨 Critical Issues\n\n"
-            for issue in analysis.get_critical_issues():
-                md += f"- **{issue.message}**\n"
+        critical_issues, high_issues, other_issues = _partition_issues(analysis)
+        if critical_issues:
+            w(_MD_CRITICAL_HEADER)
+            for issue in critical_issues:
+                w(f"- **{issue.message}**\n")
         
-        if analysis.get_high_issues():
-            md += "### ⚠️ High Priority Issues\n\n"
-            for issue in analysis.get_high_issues():
-                md += f"- **{issue.message}**\n"
+        if high_issues:
+            w(_MD_HIGH_HEADER)
+            for issue in high_issues:
+                w(f"- **{issue.message}**\n")
         
-        other_issues = [i for i in analysis.get_all_issues() if i.severity.value not in ['critical', 'high']]
         if other_issues:
-            md += "### Other Issues\n\n"
+            w("### Other Issues\n\n")
             for issue in other_issues:
-                md += f"- {issue.message}\n"
+                w(f"- {issue.message}\n")
         
         # Add top processes
-        md += "\n## Top Processes by CPU\n\n"
-        md += "| PID | Name | CPU % | Memory % | Command |\n"
-        md += "|-----|------|-------|----------|----------|\n"
+        w(_MD_PROCESS_TABLE_HEAD)
         
         for proc in metrics.top_processes.get('by_cpu', [])[:10]:
-            cmd = proc.cmdline[:50] + "..." if len(proc.cmdline) > 50 else proc.cmdline
-            md += f"| {proc.pid} | {proc.name} | {proc.cpu_percent:.1f}% | {proc.memory_percent:.1f}% | {cmd} |\n"
+            w(f"| {proc.pid} | {proc.name} | {proc.cpu_percent:.1f}% | {proc.memory_percent:.1f}% | "
+              f"{_truncate(proc.cmdline, 50)} |\n")
         
         # Add recommendations
         if analysis.recommendations:
-            md += "\n## Recommendations\n\n"
+            w("\n## Recommendations\n\n")
             for i, rec in enumerate(analysis.recommendations, 1):
-                md += f"{i}. {rec}\n"
-        
-        return md
+                w(f"{i}. {rec}\n")
+
+
+# Reporter class for each output format, text is the fallback
+_REPORTER_CLASSES = {
+    OutputFormat.TEXT: TextReporter,
+    OutputFormat.JSON: JsonReporter,
+    OutputFormat.CSV: CsvReporter,
+    OutputFormat.HTML: HtmlReporter,
+    OutputFormat.MARKDOWN: MarkdownReporter,
+}
+
+
+def get_reporter(config: Config) -> BaseReporter:
+    """Create the reporter for the configured output format"""
+    return _REPORTER_CLASSES.get(config.output_format, TextReporter)(config)
@@ -4,15 +4,20 @@
 Test interrupt analysis functionality
 """
 import sys
+import importlib
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+if not __package__:
+    # Run as a script: import the enclosing package (PEP 366)
+    _package_dir = Path(__file__).resolve().parent
+    sys.path.insert(0, str(_package_dir.parent))
+    __package__ = _package_dir.name
+    importlib.import_module(__package__)
 
-from config import Config, ConfigManager, OutputFormat
-from collector import DataCollector
-from analyzer import Analyzer
-from reporter import Reporter
+from .config import Config, ConfigManager, OutputFormat
+from .collector import DataCollector
+from .analyzer import Analyzer
+from .reporter import Reporter
 
 
 def test_interrupt_analysis():
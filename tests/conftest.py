@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared pytest configuration
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+# The repository root is the load_analyzer package itself
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _import_package() -> None:
+    """Import this checkout as load_analyzer, even when another copy is installed"""
+    module = sys.modules.get('load_analyzer')
+    if module is not None and Path(module.__file__).resolve().parent == PACKAGE_ROOT:
+        return
+    # Drop any other copy imported earlier so tests never run against it
+    for name in [name for name in sys.modules if name.partition('.')[0] == 'load_analyzer']:
+        del sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(
+        'load_analyzer', PACKAGE_ROOT / '__init__.py',
+        submodule_search_locations=[str(PACKAGE_ROOT)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['load_analyzer'] = module
+    spec.loader.exec_module(module)
+
+
+_import_package()
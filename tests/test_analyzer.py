@@ -3,9 +3,8 @@
 """
 Tests for analyzer module
 """
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import dataclasses
+import pytest
 
 from load_analyzer.config import Config
 from load_analyzer.analyzer.analyzer import Analyzer
@@ -16,57 +15,54 @@ from load_analyzer.collector.models import (
 )
 
 
+# Read-only process samples shared by all tests (copy with list(...) before mutating)
+_PROC_CPU = ProcessInfo(1234, 'test_proc', 50.0, 25.0, 4, 'test_proc --arg', 0)
+_PROC_MEM = ProcessInfo(5678, 'mem_proc', 10.0, 80.0, 2, 'mem_proc', 0)
+_TOP_PROCESSES = {
+    'by_cpu': (_PROC_CPU,),
+    'by_memory': (_PROC_MEM,),
+    'by_io': ()
+}
+
+# Baseline snapshot shared by all tests, built once (tests never mutate it)
+_BASE_METRICS = MetricsData(
+    timestamp='2025-07-11T10:30:00.123456',
+    load=LoadMetrics(1.0, 1.5, 2.0, 4),
+    cpu=CPUMetrics([10.0, 20.0, 30.0, 40.0], 25.0, 
+                   {'user': 100, 'system': 50, 'idle': 800, 'iowait': 50, 'interrupt': 10}, 
+                   5.0, 1000, 500),
+    memory=MemoryMetrics(8.0, 50.0, 4.0, 10.0, 2.0, 0.5, 1.0),
+    disk_io=DiskIOMetrics(1000, 500, 1024**3, 512*1024**2, 1000, 500),
+    network=NetworkMetrics({'ESTABLISHED': 100}, 100, 1024**2, 2*1024**2, 1000, 2000),
+    top_processes=_TOP_PROCESSES
+)
+
+
 class TestAnalyzer:
     """Test cases for Analyzer"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.config = Config()
-        self.analyzer = Analyzer(self.config)
+    @classmethod
+    def setup_class(cls):
+        """Setup test fixtures shared by all tests (config is never mutated)"""
+        cls.config = Config()
+        cls.analyzer = Analyzer(cls.config)
     
     def create_test_metrics(self, **kwargs) -> MetricsData:
-        """Create test metrics with defaults"""
-        defaults = {
-            'timestamp': '2025-07-11T10:30:00.123456',
-            'load': LoadMetrics(1.0, 1.5, 2.0, 4),
-            'cpu': CPUMetrics([10.0, 20.0, 30.0, 40.0], 25.0, 
-                             {'user': 100, 'system': 50, 'idle': 800, 'iowait': 50, 'interrupt': 10}, 
-                             5.0, 1000, 500),
-            'memory': MemoryMetrics(8.0, 50.0, 4.0, 10.0, 2.0, 0.5, 1.0),
-            'disk_io': DiskIOMetrics(1000, 500, 1024**3, 512*1024**2, 1000, 500),
-            'network': NetworkMetrics({'ESTABLISHED': 100}, 100, 1024**2, 2*1024**2, 1000, 2000),
-            'top_processes': {
-                'by_cpu': [ProcessInfo(1234, 'test_proc', 50.0, 25.0, 4, 'test_proc --arg', 0)],
-                'by_memory': [ProcessInfo(5678, 'mem_proc', 10.0, 80.0, 2, 'mem_proc', 0)],
-                'by_io': []
-            }
-        }
-        defaults.update(kwargs)
-        return MetricsData(**defaults)
+        """Create test metrics from the shared baseline, overriding the given fields"""
+        return dataclasses.replace(_BASE_METRICS, **kwargs)
     
-    def test_determine_load_status_normal(self):
-        """Test normal load status determination"""
-        metrics = self.create_test_metrics()
-        status = self.analyzer._determine_load_status(metrics)
-        assert status == LoadStatus.NORMAL
-    
-    def test_determine_load_status_high(self):
-        """Test high load status determination"""
+    @pytest.mark.parametrize("load, expected", [
+        (LoadMetrics(1.0, 1.5, 2.0, 4), LoadStatus.NORMAL),
         # Load threshold = 4 * 1.5 = 6.0, so load1 = 10.0 should be high
-        metrics = self.create_test_metrics(
-            load=LoadMetrics(10.0, 8.0, 6.0, 4)
-        )
-        status = self.analyzer._determine_load_status(metrics)
-        assert status == LoadStatus.HIGH
-    
-    def test_determine_load_status_critical(self):
-        """Test critical load status determination"""
+        (LoadMetrics(10.0, 8.0, 6.0, 4), LoadStatus.HIGH),
         # Load threshold = 4 * 1.5 = 6.0, so load1 = 15.0 should be critical
-        metrics = self.create_test_metrics(
-            load=LoadMetrics(15.0, 12.0, 10.0, 4)
-        )
+        (LoadMetrics(15.0, 12.0, 10.0, 4), LoadStatus.CRITICAL),
+    ])
+    def test_determine_load_status(self, load, expected):
+        """Test load status determination"""
+        metrics = self.create_test_metrics(load=load)
         status = self.analyzer._determine_load_status(metrics)
-        assert status == LoadStatus.CRITICAL
+        assert status == expected
     
     def test_analyze_load_high(self):
         """Test load analysis with high load"""
@@ -78,14 +74,16 @@ class TestAnalyzer:
         self.analyzer._analyze_load(metrics, result)
         
         assert len(result.primary_issues) > 0
-        load_issue = next((issue for issue in result.primary_issues if issue.type == IssueType.LOAD), None)
-        assert load_issue is not None
+        load_issues = result.get_issues_by_type().get(IssueType.LOAD, [])
+        assert load_issues
+        load_issue = load_issues[0]
+        assert load_issue in result.primary_issues
         assert load_issue.severity in [IssueSeverity.HIGH, IssueSeverity.CRITICAL]
     
     def test_analyze_cpu_high(self):
         """Test CPU analysis with high usage"""
         metrics = self.create_test_metrics(
-            cpu=CPUMetrics([90.0, 85.0, 95.0, 88.0], 89.5,  # High CPU usage
+            cpu=CPUMetrics([92.0, 90.0, 95.0, 91.0], 92.0,  # High CPU usage
                           {'user': 800, 'system': 100, 'idle': 100, 'iowait': 0, 'interrupt': 0}, 
                           0.0, 1000, 500)
         )
@@ -101,8 +99,8 @@ class TestAnalyzer:
         """Test CPU analysis with high I/O wait"""
         metrics = self.create_test_metrics(
             cpu=CPUMetrics([10.0, 15.0, 20.0, 25.0], 17.5,
-                          {'user': 100, 'system': 50, 'idle': 400, 'iowait': 450, 'interrupt': 0}, 
-                          45.0, 1000, 500)  # High iowait
+                          {'user': 100, 'system': 50, 'idle': 300, 'iowait': 550, 'interrupt': 0}, 
+                          55.0, 1000, 500)  # High iowait
         )
         result = AnalysisResult(timestamp=metrics.timestamp, load_status=LoadStatus.NORMAL)
         
@@ -155,13 +153,16 @@ class TestAnalyzer:
         assert result.summary['total_issues'] > 0
         assert result.summary['load_ratio'] > 1.0
     
-    def test_get_severity_by_ratio(self):
+    @pytest.mark.parametrize("value, expected", [
+        (50, IssueSeverity.MEDIUM),
+        (70, IssueSeverity.HIGH),
+        (90, IssueSeverity.CRITICAL),
+        (30, IssueSeverity.LOW),
+    ])
+    def test_get_severity_by_ratio(self, value, expected):
         """Test severity calculation by ratio"""
-        # Test different severity levels
-        assert self.analyzer._get_severity_by_ratio(50, 40, 1.5, 2.0) == IssueSeverity.MEDIUM
-        assert self.analyzer._get_severity_by_ratio(70, 40, 1.5, 2.0) == IssueSeverity.HIGH
-        assert self.analyzer._get_severity_by_ratio(90, 40, 1.5, 2.0) == IssueSeverity.CRITICAL
-        assert self.analyzer._get_severity_by_ratio(30, 40, 1.5, 2.0) == IssueSeverity.LOW
+        # high/critical are absolute bounds, here 1.5x and 2.0x the threshold of 40
+        assert self.analyzer._get_severity_by_ratio(value, 40, 60, 80) == expected
     
     def test_generate_recommendations(self):
         """Test recommendation generation"""
@@ -183,6 +184,7 @@ class TestAnalyzer:
         assert len(result.recommendations) > 0
         assert "Scale CPU" in result.recommendations
         assert "Add memory" in result.recommendations
+        assert "High CPU and memory usage detected - consider vertical scaling" in result.recommendations
     
     def test_create_summary(self):
         """Test summary creation"""
@@ -216,10 +218,4 @@ class TestAnalyzer:
 
 
 if __name__ == '__main__':
-    # Simple test runner
-    import unittest
-    
-    class TestAnalyzerUnittest(unittest.TestCase, TestAnalyzer):
-        pass
-    
-    unittest.main()
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for config module
+"""
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from load_analyzer.config import ConfigManager
+
+
+class TestConfigManager:
+    """Test cases for ConfigManager"""
+    
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        """Write a JSON config file and give each test an empty parse cache"""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({'cpu_threshold': 70.0, 'extra': {'level': 1}}), encoding='utf-8')
+        with patch.object(ConfigManager, '_CACHE', {}):
+            yield path
+    
+    def test_load_config_file_cache_hit(self, config_file):
+        """Test an unchanged file is parsed only once"""
+        with patch.object(ConfigManager, '_parse_config_file',
+                          wraps=ConfigManager._parse_config_file) as parse:
+            first = ConfigManager._load_config_file(str(config_file))
+            second = ConfigManager._load_config_file(str(config_file))
+        
+        assert parse.call_count == 1
+        assert first == second == {'cpu_threshold': 70.0, 'extra': {'level': 1}}
+    
+    def test_load_config_file_reparses_changed_file(self, config_file):
+        """Test a new mtime reparses the file and evicts the stale entry"""
+        ConfigManager._load_config_file(str(config_file))
+        
+        config_file.write_text(json.dumps({'cpu_threshold': 90.0}), encoding='utf-8')
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        with patch.object(ConfigManager, '_parse_config_file',
+                          wraps=ConfigManager._parse_config_file) as parse:
+            data = ConfigManager._load_config_file(str(config_file))
+        
+        assert parse.call_count == 1
+        assert data == {'cpu_threshold': 90.0}
+        assert list(ConfigManager._CACHE) == [(os.path.abspath(config_file), os.stat(config_file).st_mtime_ns)]
+    
+    def test_load_config_file_returns_copies(self, config_file):
+        """Test callers cannot change the cached data, nested sections included"""
+        data = ConfigManager._load_config_file(str(config_file))
+        data['cpu_threshold'] = 10.0
+        data['extra']['level'] = 2
+        
+        assert ConfigManager._load_config_file(str(config_file)) == {
+            'cpu_threshold': 70.0, 'extra': {'level': 1}
+        }
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -3,10 +3,12 @@
 """
 Tests for reporter module
 """
-import sys
-import os
+import dataclasses
+import io
 import json
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from unittest.mock import patch
+
+import pytest
 
 from load_analyzer.config import Config, OutputFormat
 from load_analyzer.reporter.reporters import (
@@ -14,7 +16,7 @@ from load_analyzer.reporter.reporters import (
 )
 from load_analyzer.collector.models import (
     MetricsData, LoadMetrics, CPUMetrics, MemoryMetrics, 
-    DiskIOMetrics, NetworkMetrics, ProcessInfo
+    DiskIOMetrics, NetworkMetrics, ProcessInfo, InterruptMetrics, InterruptInfo
 )
 from load_analyzer.analyzer.models import (
     AnalysisResult, Issue, IssueType, IssueSeverity, LoadStatus
@@ -24,12 +26,13 @@ from load_analyzer.analyzer.models import (
 class TestReporter:
     """Test cases for Reporter classes"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.config = Config()
+    @classmethod
+    def setup_class(cls):
+        """Setup test fixtures shared by all tests (tests never mutate them)"""
+        cls.config = Config()
         
         # Create test metrics
-        self.metrics = MetricsData(
+        cls.metrics = MetricsData(
             timestamp='2025-07-11T10:30:00.123456',
             load=LoadMetrics(8.5, 6.2, 4.1, 4),
             cpu=CPUMetrics([85.0, 78.0, 92.0, 88.0], 85.75,
@@ -55,13 +58,13 @@ class TestReporter:
         )
         
         # Create test analysis
-        self.analysis = AnalysisResult(
-            timestamp=self.metrics.timestamp,
+        cls.analysis = AnalysisResult(
+            timestamp=cls.metrics.timestamp,
             load_status=LoadStatus.HIGH
         )
         
         # Add test issues
-        self.analysis.primary_issues = [
+        cls.analysis.primary_issues = [
             Issue(
                 type=IssueType.CPU,
                 severity=IssueSeverity.HIGH,
@@ -69,7 +72,7 @@ class TestReporter:
                 value=85.8,
                 threshold=80.0,
                 recommendation="Consider CPU scaling or process optimization",
-                related_processes=self.metrics.top_processes['by_cpu'][:2]
+                related_processes=cls.metrics.top_processes['by_cpu'][:2]
             ),
             Issue(
                 type=IssueType.LOAD,
@@ -81,7 +84,7 @@ class TestReporter:
             )
         ]
         
-        self.analysis.secondary_issues = [
+        cls.analysis.secondary_issues = [
             Issue(
                 type=IssueType.MEMORY,
                 severity=IssueSeverity.MEDIUM,
@@ -89,7 +92,7 @@ class TestReporter:
                 value=82.5,
                 threshold=80.0,
                 recommendation="Consider memory scaling or optimize memory-intensive processes",
-                related_processes=self.metrics.top_processes['by_memory'][:1]
+                related_processes=cls.metrics.top_processes['by_memory'][:1]
             ),
             Issue(
                 type=IssueType.NETWORK,
@@ -101,14 +104,14 @@ class TestReporter:
             )
         ]
         
-        self.analysis.recommendations = [
+        cls.analysis.recommendations = [
             "Consider CPU scaling or process optimization",
             "Investigate CPU, I/O, or process issues",
             "Consider memory scaling or optimize memory-intensive processes",
             "Check for connection leaks or scaling needs"
         ]
         
-        self.analysis.summary = {
+        cls.analysis.summary = {
             'total_issues': 4,
             'critical_issues': 0,
             'high_issues': 2,
@@ -123,29 +126,25 @@ class TestReporter:
     
     def test_reporter_factory_text(self):
         """Test reporter factory for text format"""
-        config = Config()
-        config.output_format = OutputFormat.TEXT
+        config = Config(output_format=OutputFormat.TEXT)
         reporter = Reporter(config)
         assert isinstance(reporter._reporter, TextReporter)
     
     def test_reporter_factory_json(self):
         """Test reporter factory for JSON format"""
-        config = Config()
-        config.output_format = OutputFormat.JSON
+        config = Config(output_format=OutputFormat.JSON)
         reporter = Reporter(config)
         assert isinstance(reporter._reporter, JsonReporter)
     
     def test_reporter_factory_csv(self):
         """Test reporter factory for CSV format"""
-        config = Config()
-        config.output_format = OutputFormat.CSV
+        config = Config(output_format=OutputFormat.CSV)
         reporter = Reporter(config)
         assert isinstance(reporter._reporter, CsvReporter)
     
     def test_reporter_factory_html(self):
         """Test reporter factory for HTML format"""
-        config = Config()
-        config.output_format = OutputFormat.HTML
+        config = Config(output_format=OutputFormat.HTML)
         reporter = Reporter(config)
         assert isinstance(reporter._reporter, HtmlReporter)
     
@@ -167,8 +166,7 @@ class TestReporter:
     def test_text_reporter_colorize(self):
         """Test text reporter colorization"""
         # Test with colors enabled
-        config = Config()
-        config.enable_colors = True
+        config = Config(enable_colors=True)
         reporter = TextReporter(config)
         
         colored_text = reporter.colorize("test", "red")
@@ -176,7 +174,7 @@ class TestReporter:
         assert "\033[0m" in colored_text   # Reset code
         
         # Test with colors disabled
-        config.enable_colors = False
+        config = Config(enable_colors=False)
         reporter = TextReporter(config)
         
         uncolored_text = reporter.colorize("test", "red")
@@ -203,6 +201,52 @@ class TestReporter:
         assert len(data['analysis']['primary_issues']) == 2
         assert len(data['analysis']['secondary_issues']) == 2
     
+    def test_json_reporter_orjson_matches_stdlib(self):
+        """Test the orjson fast path emits the same document as the json fallback"""
+        pytest.importorskip('orjson')
+        # Interrupt metrics have a to_dict() order that differs from their field order
+        metrics = dataclasses.replace(self.metrics, interrupts=InterruptMetrics(
+            total_interrupts=123456, system_context_switches=999, interrupt_rate=5000.0,
+            network_interrupts=[InterruptInfo(40, 'eth0-TxRx-0', 10000, [9000, 1000, 0, 0], 3000.0)],
+            cpu_interrupt_distribution=[90000, 20000, 10000, 3456]
+        ))
+        reporter = JsonReporter(self.config)
+        fast_report = reporter.generate_report(metrics, self.analysis)
+        
+        with patch('load_analyzer.reporter.reporters.orjson', None):
+            fallback_report = reporter.generate_report(metrics, self.analysis)
+        
+        assert fast_report == fallback_report
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_reporter_write_report(self, use_orjson):
+        """Test streaming the JSON report matches the generated string"""
+        reporter = JsonReporter(self.config)
+        sink = io.StringIO()
+        
+        if use_orjson:
+            pytest.importorskip('orjson')
+            reporter.write_report(self.metrics, self.analysis, sink)
+            expected = reporter.generate_report(self.metrics, self.analysis)
+        else:
+            with patch('load_analyzer.reporter.reporters.orjson', None):
+                reporter.write_report(self.metrics, self.analysis, sink)
+                expected = reporter.generate_report(self.metrics, self.analysis)
+        
+        assert sink.getvalue() == expected
+    
+    @pytest.mark.parametrize("output_format", [OutputFormat.TEXT, OutputFormat.JSON, OutputFormat.CSV, OutputFormat.HTML])
+    def test_reporter_write_report(self, output_format):
+        """Test writing through an encoded byte stream matches generate_report_bytes"""
+        reporter = Reporter(Config(output_format=output_format))
+        buffer = io.BytesIO()
+        sink = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+        
+        reporter.write_report(self.metrics, self.analysis, sink)
+        sink.flush()
+        
+        assert buffer.getvalue() == reporter.generate_report_bytes(self.metrics, self.analysis)
+    
     def test_csv_reporter_generate_report(self):
         """Test CSV reporter report generation"""
         reporter = CsvReporter(self.config)
@@ -226,6 +270,18 @@ class TestReporter:
         assert '85.75' in data_row
         assert '82.5' in data_row
     
+    def test_csv_reporter_append_row(self):
+        """Test appending CSV rows to an open stream"""
+        reporter = CsvReporter(self.config)
+        sink = io.StringIO()
+        reporter.append_row(self.metrics, self.analysis, sink)
+        reporter.append_row(self.metrics, self.analysis, sink)
+        
+        lines = sink.getvalue().splitlines()
+        assert len(lines) == 3
+        assert lines[0].startswith('timestamp,load_status')
+        assert lines[1] == lines[2]
+    
     def test_html_reporter_generate_report(self):
         """Test HTML reporter report generation"""
         reporter = HtmlReporter(self.config)
@@ -240,6 +296,17 @@ class TestReporter:
         assert "<table>" in report
         assert "Recommendations" in report
     
+    def test_html_reporter_escapes_text(self):
+        """Test HTML reporter escapes free text such as recommendations"""
+        analysis = dataclasses.replace(
+            self.analysis, recommendations=["echo <CPU-mask> > /proc/irq/<IRQ-number>/smp_affinity"]
+        )
+        reporter = HtmlReporter(self.config)
+        report = reporter.generate_report(self.metrics, analysis)
+        
+        assert "<li>echo &lt;CPU-mask&gt; &gt; /proc/irq/&lt;IRQ-number&gt;/smp_affinity</li>" in report
+        assert "<CPU-mask>" not in report
+    
     def test_text_reporter_format_bytes(self):
         """Test byte formatting in text reporter"""
         reporter = TextReporter(self.config)
@@ -252,8 +319,7 @@ class TestReporter:
     
     def test_text_reporter_get_threshold_color(self):
         """Test threshold color determination"""
-        config = Config()
-        config.enable_colors = True
+        config = Config(enable_colors=True)
         reporter = TextReporter(config)
         
         # Value below threshold should be green
@@ -267,8 +333,7 @@ class TestReporter:
     
     def test_text_reporter_get_status_color(self):
         """Test status color determination"""
-        config = Config()
-        config.enable_colors = True
+        config = Config(enable_colors=True)
         reporter = TextReporter(config)
         
         assert reporter._get_status_color('normal') == 'green'
@@ -303,13 +368,28 @@ class TestReporter:
             # Clean up
             if os.path.exists(temp_filename):
                 os.unlink(temp_filename)
+    
+    def test_reporter_generate_report_bytes(self):
+        """Test generating encoded reports"""
+        config = Config(output_format=OutputFormat.JSON)
+        reporter = Reporter(config)
+        
+        report_bytes = reporter.generate_report_bytes(self.metrics, self.analysis)
+        assert isinstance(report_bytes, bytes)
+        assert json.loads(report_bytes) == json.loads(reporter.generate_report(self.metrics, self.analysis))
+    
+    def test_reporter_generate_reports(self):
+        """Test generating several formats from one snapshot"""
+        reporter = Reporter(self.config)
+        reports = reporter.generate_reports(
+            self.metrics, self.analysis,
+            [OutputFormat.JSON, OutputFormat.CSV, OutputFormat.JSON]
+        )
+        
+        assert list(reports) == [OutputFormat.JSON, OutputFormat.CSV]
+        assert json.loads(reports[OutputFormat.JSON])['analysis']['load_status'] == 'high'
+        assert reports[OutputFormat.CSV].startswith('timestamp,load_status')
 
 
 if __name__ == '__main__':
-    # Simple test runner
-    import unittest
-    
-    class TestReporterUnittest(unittest.TestCase, TestReporter):
-        pass
-    
-    unittest.main()
+    raise SystemExit(pytest.main([__file__]))